@@ -117,8 +117,7 @@ class CARDTargetAnnotationProvider(StashableBase):
             for matchD in matchDL:
                 #
                 tCmtD = self.__decodeComment(matchD["target"])
-                entryId = tCmtD["entityId"].split("_")[0]
-                entityId = tCmtD["entityId"].split("_")[1]
+                entryId, entityId = tCmtD["entityId"].split("_")[:2]
                 seqIdPct = matchD["sequenceIdentity"]
                 bitScore = matchD["bitScore"]
                 nm = cardP.getModelValue(modelId, "modelName")
@@ -111,8 +111,7 @@ class CARDTargetFeatureProvider(StashableBase):
                 else:
                     fpL = [{"beg_seq_id": matchD["targetBegin"], "end_seq_id": matchD["targetEnd"]}]
                 tCmtD = self.__decodeComment(matchD["target"])
-                entryId = tCmtD["entityId"].split("_")[0]
-                entityId = tCmtD["entityId"].split("_")[1]
+                entryId, entityId = tCmtD["entityId"].split("_")[:2]
                 nm = cardP.getModelValue(modelId, "modelName")
                 descr = cardP.getModelValue(modelId, "descr")
                 featureId = cardP.getModelValue(modelId, "cvTermId")
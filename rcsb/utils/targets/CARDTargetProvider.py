@@ -5,6 +5,7 @@
 #  Updates:
 #   14-Mar-2023 dwp  Add filterForHomologs() method to filter CARD data for only protein homolog models;
 #                    Remove unused getTargetDataPath() and getCofactorDataPath() methods
+#   16-Oct-2026 dwp  Replace exception handling in getModelValue() with chained dictionary lookups
 ##
 """
 Accessors for CARD target assignments.
@@ -21,6 +22,8 @@ from rcsb.utils.io.MarshalUtil import MarshalUtil
 
 logger = logging.getLogger(__name__)
 
+_EMPTY = {}
+
 
 class CARDTargetProvider:
     """Accessors for CARD target assignments."""
@@ -44,10 +47,7 @@ class CARDTargetProvider:
         return modelId in self.__oD
 
     def getModelValue(self, modelId, key):
-        try:
-            return self.__oD[modelId][key]
-        except Exception:
-            return None
+        return self.__oD.get(modelId, _EMPTY).get(key)
 
     def getAssignmentVersion(self):
         return self.__version
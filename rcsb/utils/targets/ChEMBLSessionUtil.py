@@ -0,0 +1,138 @@
+##
+#  File:           ChEMBLSessionUtil.py
+#  Date:           16-Oct-2026 dwp
+#
+#  Updated:
+#  16-Oct-2026 dwp  Add getChEMBLResource() to share the client resource handles
+#  16-Oct-2026 dwp  Add setChEMBLRateLimit() to cap the shared session request rate
+##
+"""
+Shared HTTP session management for ChEMBL web service requests.
+
+The chembl_webresource_client creates a new HTTP session for each query object, and hence
+a new TCP/TLS connection for each request.  The utilities here maintain a single pooled
+session per process that can be attached to client query sets before they are evaluated,
+and a cache of the client resource handles configured for JSON output.  Throttled (HTTP 429)
+requests are retried honoring any Retry-After header, and an optional process-wide rate limit
+keeps bursts of concurrent requests below the service throttling threshold.
+"""
+
+import logging
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# pylint: disable=ungrouped-imports
+try:
+    from chembl_webresource_client.new_client import new_client  # fails when service is down
+except Exception:
+    pass
+
+logger = logging.getLogger(__name__)
+
+_SESSION = None
+_SESSION_PID = None
+_RESOURCE_D = {}
+_RATE_LIMITER = None
+
+
+class _RateLimiter(object):
+    """Thread-safe limiter spacing requests at no more than maxPerSecond per second."""
+
+    def __init__(self, maxPerSecond):
+        self.__interval = 1.0 / maxPerSecond
+        self.__nextTime = 0.0
+        self.__lock = threading.Lock()
+
+    def wait(self):
+        with self.__lock:
+            now = time.monotonic()
+            waitTime = self.__nextTime - now
+            self.__nextTime = max(now, self.__nextTime) + self.__interval
+        if waitTime > 0:
+            time.sleep(waitTime)
+
+
+class _ChEMBLSession(requests.Session):
+    """Session applying the (optional) process-wide ChEMBL request rate limit."""
+
+    def request(self, method, url, *args, **kwargs):  # pylint: disable=arguments-differ
+        if _RATE_LIMITER is not None:
+            _RATE_LIMITER.wait()
+        return super(_ChEMBLSession, self).request(method, url, *args, **kwargs)
+
+
+def setChEMBLRateLimit(maxPerSecond=None):
+    """Set the maximum rate of ChEMBL requests issued by this process through the shared session.
+
+    This is a process-wide setting: the limit applies to all ChEMBL providers and worker threads
+    in the process using the shared session, and remains in effect until it is reset with
+    setChEMBLRateLimit(None).
+
+    Args:
+        maxPerSecond (float, optional): maximum requests per second or None for no limit (default: None)
+    """
+    global _RATE_LIMITER  # pylint: disable=global-statement
+    _RATE_LIMITER = _RateLimiter(maxPerSecond) if maxPerSecond else None
+
+
+def getChEMBLSession(poolConnections=32, poolMaxSize=64, retries=3, backoffFactor=0.5):
+    """Return the shared (per-process) HTTP session for ChEMBL requests.
+
+    Args:
+        poolConnections (int, optional): number of connection pools to cache (default: 32)
+        poolMaxSize (int, optional): maximum number of connections saved in each pool (default: 64)
+        retries (int, optional): number of retries for failed or throttled requests (default: 3)
+        backoffFactor (float, optional): retry backoff factor in seconds (default: 0.5)
+
+    Returns:
+        requests.Session: pooled session object
+    """
+    global _SESSION, _SESSION_PID  # pylint: disable=global-statement
+    # Sessions are not shared across forked worker processes
+    if _SESSION is None or _SESSION_PID != os.getpid():
+        retry = Retry(total=retries, backoff_factor=backoffFactor, status_forcelist=[429, 502, 503, 504], allowed_methods=None)
+        adapter = HTTPAdapter(pool_connections=poolConnections, pool_maxsize=poolMaxSize, max_retries=retry)
+        session = _ChEMBLSession()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _SESSION = session
+        _SESSION_PID = os.getpid()
+        logger.debug("Created ChEMBL session for process %r", _SESSION_PID)
+    return _SESSION
+
+
+def attachChEMBLSession(querySet):
+    """Attach the shared session to the input chembl_webresource_client query set.
+
+    Args:
+        querySet (obj): chembl_webresource_client query set
+
+    Returns:
+        obj: the input query set
+    """
+    query = getattr(querySet, "query", None)
+    if query is not None and hasattr(query, "session"):
+        query.session = getChEMBLSession()
+    return querySet
+
+
+def getChEMBLResource(resourceName):
+    """Return the (cached) chembl_webresource_client resource handle configured for JSON output.
+
+    Args:
+        resourceName (str): client resource name (e.g., activity, mechanism, molecule)
+
+    Returns:
+        obj: chembl_webresource_client resource
+    """
+    resource = _RESOURCE_D.get(resourceName)
+    if resource is None:
+        resource = getattr(new_client, resourceName)
+        resource.set_format("json")
+        _RESOURCE_D[resourceName] = resource
+    return resource
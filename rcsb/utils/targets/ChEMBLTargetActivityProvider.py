@@ -5,6 +5,27 @@
 #  Updated:
 #   9-Feb-2023 aae  Update ChEMBL baseVersion to 31
 #  18-Jul-2023 dwp  Update ChEMBL baseVersion to 33
+#  16-Oct-2026 dwp  Simplify target activity accessors
+#  16-Oct-2026 dwp  Share the molecule, mechanism and activity fetch code between the serial and multiprocessing paths
+#  16-Oct-2026 dwp  Store the mechanism action under the 'action' key in the serial fetch path (was 'action_type')
+#  16-Oct-2026 dwp  Use orjson (when available) to read and write the activity data cache
+#  16-Oct-2026 dwp  Checkpoint fetched chunks to an append-only JSONL file and write the full activity data file once
+#  16-Oct-2026 dwp  Reuse a pooled HTTP session for ChEMBL activity, molecule and mechanism requests
+#  16-Oct-2026 dwp  Fetch molecule and mechanism details in batches for each chunk of activity records
+#  16-Oct-2026 dwp  Add an on-disk molecule and mechanism details cache shared by the fetch workers
+#  16-Oct-2026 dwp  Memoize single identifier molecule and mechanism detail lookups for the life of the process
+#  16-Oct-2026 dwp  Issue the batched molecule and mechanism detail requests for each chunk concurrently
+#  16-Oct-2026 dwp  Keep the previously tried target identifiers in a set
+#  16-Oct-2026 dwp  Simplify molecule and mechanism record selection
+#  16-Oct-2026 dwp  Read the activity data file incrementally
+#  16-Oct-2026 dwp  Add getSequenceMatches() to share the parsed sequence match results
+#  16-Oct-2026 dwp  Add opt-in (None) sizing of the multiprocessing fetch to the available processors
+#  16-Oct-2026 dwp  Discard the molecule and mechanism details cache when the ChEMBL release changes
+#  16-Oct-2026 dwp  Use orjson (when available) to read the sequence match file
+#  16-Oct-2026 dwp  Drop duplicate target identifiers before batching
+#  16-Oct-2026 dwp  Keep the molecule and mechanism details cache across rebuilds (unless clearDetailCache=True)
+#  16-Oct-2026 dwp  Do not share failed sequence match reads and add clearSequenceMatches()
+#  16-Oct-2026 dwp  Request the ChEMBL release for the details cache check at most once per instance (or take chemblVersion)
 ##
 """
 Accessors for ChEMBL target activity data.
@@ -12,31 +33,111 @@ Accessors for ChEMBL target activity data.
 """
 
 import datetime
+import functools
 import logging
 import os.path
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 
 from chembl_webresource_client.settings import Settings
 
-# pylint: disable=ungrouped-imports
-try:
-    from chembl_webresource_client.new_client import new_client  # fails when service is down
-except Exception:
-    pass
-
 from rcsb.utils.multiproc.MultiProcUtil import MultiProcUtil
 from rcsb.utils.io.FileUtil import FileUtil
 from rcsb.utils.io.MarshalUtil import MarshalUtil
 from rcsb.utils.io.StashableBase import StashableBase
 from rcsb.utils.io.UrlRequestUtil import UrlRequestUtil
+from rcsb.utils.targets.ChEMBLSessionUtil import attachChEMBLSession, getChEMBLResource
+from rcsb.utils.targets.FastJsonUtil import fastJsonDump, fastJsonDumpStream, fastJsonLinesAppend, fastJsonLinesLoad, fastJsonLoad, fastJsonLoadStream
 
 
-Settings.Instance().TIMEOUT = 10  # pylint: disable=no-member
-Settings.Instance().MAX_LIMIT = 50  # pylint: disable=no-member
+_SETTINGS = Settings.Instance()
+_SETTINGS.TIMEOUT = 10  # pylint: disable=no-member
+_SETTINGS.MAX_LIMIT = 50  # pylint: disable=no-member
 Settings.MAX_LIMIT = 50
 
 logger = logging.getLogger(__name__)
 
+_ACTIVITY_ATTRIBUTES = [
+    "assay_chembl_id",
+    "assay_description",
+    "assay_type",
+    "canonical_smiles",
+    "ligand_efficiency",
+    "molecule_chembl_id",
+    "parent_molecule_chembl_id",
+    "pchembl_value",
+    "standard_relation",
+    "standard_type",
+    "standard_units",
+    "standard_value",
+    "target_chembl_id",
+]
+_STANDARD_TYPES = ["IC50", "Ki", "EC50", "Kd"]
+# Guards updates to the molecule and mechanism details cache shared by the fetch threads
+_DETAIL_CACHE_LOCK = threading.Lock()
+_MAX_REQUEST_IDS = 50
+
+
+def _moleculeSelect(tD):
+    tD = tD or {}
+    msD = tD.get("molecule_structures") or {}
+    return tD.get("pref_name"), msD.get("standard_inchi_key"), msD.get("canonical_smiles")
+
+
+def _mechanismSelect(tD):
+    tD = tD or {}
+    return tD.get("action_type"), tD.get("mechanism_of_action"), tD.get("max_phase")
+
+
+@functools.lru_cache(maxsize=100000)
+def _fetchMoleculeDetails(chemblId):
+    """Return the (memoized) molecule details (name, inchiKey, smiles) for the input ChEMBL molecule identifier.
+
+    Request failures are raised rather than returned, so that they are not cached.
+    """
+    atL = ["pref_name", "molecule_structures"]
+    molecule = getChEMBLResource("molecule")
+    tD = next(iter(attachChEMBLSession(molecule.filter(molecule_chembl_id__exact=chemblId).only(atL))), None)
+    return _moleculeSelect(tD)
+
+
+@functools.lru_cache(maxsize=100000)
+def _fetchMechanismDetails(chemblId):
+    """Return the (memoized) details (actionType, moa, maxPhase) of the first mechanism record for the input
+    ChEMBL molecule identifier.  Molecules without mechanism records are cached as (None, None, None).
+
+    Request failures are raised rather than returned, so that they are not cached.
+    """
+    atL = ["action_type", "mechanism_of_action", "max_phase"]
+    mechanism = getChEMBLResource("mechanism")
+    tD = next(iter(attachChEMBLSession(mechanism.filter(molecule_chembl_id__exact=chemblId).only(atL))), None)
+    return _mechanismSelect(tD)
+
+
+def _decodeComment(comment, separator="|"):
+    dD = {}
+    try:
+        ti = iter(comment.split(separator))
+        dD = {tup[1]: tup[0] for tup in zip(ti, ti)}
+    except Exception:
+        pass
+    return dD
+
+
+@functools.lru_cache(maxsize=1)
+def _loadSequenceMatches(filePath, mTime):
+    """Return the (memoized) sequence match dictionary and the decoded query comments for the input file.
+    The file modification time is part of the cache key so that updated files are reread.
+    Unreadable or empty files raise ValueError (and are not cached).
+    """
+    _ = mTime
+    mD = fastJsonLoad(filePath)
+    if not mD:
+        raise ValueError("Missing or empty sequence match file %r" % filePath)
+    return mD, {queryId: _decodeComment(queryId) for queryId in mD}
+
 
 class ChEMBLTargetActivityWorker(object):
     """A skeleton worker class that implements the interface expected by the multiprocessing module
@@ -47,100 +148,207 @@ class ChEMBLTargetActivityWorker(object):
         _ = kwargs
 
     def fetchActivity(self, dataList, procName, optionsD, workingDir):
-        """Fetch ChEMBL activity for the input ChEMBL target identifier list"""
-        _ = workingDir
+        """Fetch ChEMBL activity for the input ChEMBL target identifier list.
+
+        If a working directory is provided, the activity results are appended to a per-process JSONL
+        shard file in that directory and the shard file path is returned in place of the results.
+        """
         successList = []
         failList = []
+        failS = set()
         retList = []
+        detailList = []
         diagList = []
         #
         try:
-            chunkSize = optionsD.get("chunkSize", 50)
-            atL = optionsD.get("attributeList", [])
+            chunkSize = min(optionsD.get("chunkSize", _MAX_REQUEST_IDS), _MAX_REQUEST_IDS)
+            atL = optionsD.get("attributeList", _ACTIVITY_ATTRIBUTES)
             maxActivity = optionsD.get("maxActivity", None)
-
-            for ii in range(0, len(dataList), chunkSize):
-                logger.info("Begin chunk at ii %d/(for %d targets)", ii, len(dataList))
+            numDetailThreads = optionsD.get("numDetailThreads", 4)
+            detailCacheD = optionsD.get("detailCache", None)
+            detailCacheD = detailCacheD if detailCacheD is not None else {}
+            molCacheD = detailCacheD.setdefault("molecule", {})
+            mechCacheD = detailCacheD.setdefault("mechanism", {})
+
+            act = getChEMBLResource("activity")
+            # Worker invocations typically receive a single request sized batch of identifiers
+            idChunkL = [dataList] if len(dataList) <= chunkSize else [dataList[ii: ii + chunkSize] for ii in range(0, len(dataList), chunkSize)]
+            for ii, idChunk in enumerate(idChunkL):
+                logger.debug("Begin chunk %d/%d (for %d targets)", ii + 1, len(idChunkL), len(dataList))
                 try:
-                    act = new_client.activity  # pylint: disable=no-member
-                    act.set_format("json")
-                    actDL = (
-                        act.filter(target_chembl_id__in=dataList[ii: ii + chunkSize])
-                        .filter(standard_type__in=["IC50", "Ki", "EC50", "Kd"])
+                    actDL = attachChEMBLSession(
+                        act.filter(target_chembl_id__in=idChunk)
+                        .filter(standard_type__in=_STANDARD_TYPES)
                         .filter(standard_value__isnull=False)
                         .order_by("-standard_value")
                         .only(atL)
                     )
-                    logger.info("Results (%d)", len(actDL))
-                    if actDL:
-                        for actD in actDL[:maxActivity] if maxActivity else actDL:
-                            actD = self.__activitySelect(atL, actD)
-                            actD["molecule_name"], actD["inchi_key"], _ = self.__getMoleculeDetails(actD["molecule_chembl_id"])
-                            actD["action"], actD["moa"], actD["max_phase"] = self.__getMechanismDetails(actD["molecule_chembl_id"])
+                    uniqueIt = self.__uniqueActivity(atL, actDL)
+                    chunkL = list(islice(uniqueIt, maxActivity) if maxActivity else uniqueIt)
+                    logger.debug("Results (%d)", len(chunkL))
+                    if chunkL:
+                        molIdL = list({actD["molecule_chembl_id"] for actD in chunkL})
+                        self.__updateDetailCache(molIdL, molCacheD, mechCacheD, detailList, numThreads=numDetailThreads)
+                        for actD in chunkL:
+                            molId = actD["molecule_chembl_id"]
+                            actD["molecule_name"], actD["inchi_key"], _ = molCacheD.get(molId, (None, None, None))
+                            actD["action"], actD["moa"], actD["max_phase"] = mechCacheD.get(molId, (None, None, None))
                             retList.append((actD["target_chembl_id"], actD))
                 except Exception as e:
-                    logger.exception("Failing for chunk starting at %d with %s", ii, str(e)[:200])
-            successList = sorted(set(dataList) - set(failList))
+                    logger.exception("Failing for chunk %d with %s", ii + 1, str(e)[:200])
+                    failList.extend(idChunk)
+                    failS.update(idChunk)
+            successList = [tId for tId in dataList if tId not in failS] if failS else list(dataList)
             if failList:
                 logger.info("%s returns %d definitions with failures: %r", procName, len(failList), failList)
 
             logger.debug("%s built target interactions for %d/%d entries failures %d", procName, len(retList), len(dataList), len(failList))
+            if workingDir and retList:
+                shardPath = os.path.join(workingDir, "activity-shard-%d.jsonl" % os.getpid())
+                if not fastJsonLinesAppend(shardPath, retList):
+                    raise IOError("Failed writing activity shard %r" % shardPath)
+                retList = [shardPath]
         except Exception as e:
             logger.exception("Failing %s for %d data items %s", procName, len(dataList), str(e))
         #
-        return successList, retList, diagList
+        return successList, retList, detailList, diagList
+
+    def __updateDetailCache(self, chemblIdList, molCacheD, mechCacheD, detailList, numThreads=4):
+        """Fetch molecule and mechanism details for identifiers missing from the input cache dictionaries.
+
+        The batched molecule and mechanism requests are issued concurrently in a thread pool.
+        New cache entries are also recorded in detailList as (detailType, chemblId, details) tuples.
+        """
+        taskL = []
+        for detailType, cacheD in (("molecule", molCacheD), ("mechanism", mechCacheD)):
+            missL = [tId for tId in chemblIdList if tId not in cacheD]
+            taskL.extend((detailType, cacheD, missL[ii: ii + _MAX_REQUEST_IDS]) for ii in range(0, len(missL), _MAX_REQUEST_IDS))
+        if not taskL:
+            return
+        fetchD = {"molecule": self.getMoleculeDetailsBatch, "mechanism": self.getMechanismDetailsBatch}
+        if numThreads > 1 and len(taskL) > 1:
+            with ThreadPoolExecutor(max_workers=min(numThreads, len(taskL))) as executor:
+                futureD = {executor.submit(fetchD[detailType], idL): (detailType, cacheD) for detailType, cacheD, idL in taskL}
+                resultL = [futureD[future] + (future.result(),) for future in as_completed(futureD)]
+        else:
+            resultL = [(detailType, cacheD, fetchD[detailType](idL)) for detailType, cacheD, idL in taskL]
+        # The cache dictionaries may be shared by concurrent fetch threads (fetchTargetActivityDataThreaded())
+        with _DETAIL_CACHE_LOCK:
+            for detailType, cacheD, fD in resultL:
+                for tId, tT in fD.items():
+                    cacheD[tId] = list(tT)
+                    detailList.append((detailType, tId, cacheD[tId]))
+        logger.debug("Fetched details in (%d) requests for (%d) identifiers", len(taskL), len(chemblIdList))
+
+    def __uniqueActivity(self, atL, actDL):
+        """Yield selected activity records skipping duplicate (target, molecule, assay, type, value) records."""
+        seenS = set()
+        for actD in actDL:
+            actD = self.__activitySelect(atL, actD)
+            key = (actD.get("target_chembl_id"), actD.get("molecule_chembl_id"), actD.get("assay_chembl_id"), actD.get("standard_type"), actD.get("standard_value"))
+            if key in seenS:
+                continue
+            seenS.add(key)
+            yield actD
 
     def __activitySelect(self, atL, aD):
-        return {at: aD[at] if at in aD else None for at in atL}
+        aGet = aD.get
+        return {at: aGet(at) for at in atL}
 
-    def __getMoleculeDetails(self, chemblId):
+    def getMoleculeDetails(self, chemblId):
         name = inchiKey = smiles = None
         try:
-            atL = ["pref_name", "molecule_structures"]
-            molecule = new_client.molecule  # pylint: disable=no-member
-            molecule.set_format("json")
-            tD = molecule.filter(molecule_chembl_id__exact=chemblId).only(atL)[0]
-            name = tD["pref_name"] if tD and "pref_name" in tD else None
-            if tD and "molecule_structures" in tD and tD["molecule_structures"]:
-                smiles = tD["molecule_structures"]["canonical_smiles"] if tD and "molecule_structures" in tD and "canonical_smiles" in tD["molecule_structures"] else None
-                inchiKey = tD["molecule_structures"]["standard_inchi_key"] if tD and "molecule_structures" in tD and "standard_inchi_key" in tD["molecule_structures"] else None
+            name, inchiKey, smiles = _fetchMoleculeDetails(chemblId)
         except Exception as e:
             logger.exception("Failing for %s with %s", chemblId, str(e))
         return name, inchiKey, smiles
 
-    def __getMechanismDetails(self, chemblId):
+    def getMoleculeDetailsBatch(self, chemblIdList, chunkSize=50):
+        """Get molecule details for the input list of ChEMBL molecule identifiers using batched requests.
+
+        Args:
+            chemblIdList (list): list of ChEMBL molecule identifiers
+            chunkSize (int, optional): number of identifiers per request (default: 50, maximum: 50)
+
+        Returns:
+            dict: {chemblId: (name, inchiKey, smiles), ...} (identifiers in failed requests are omitted)
+        """
+        rD = {}
+        atL = ["molecule_chembl_id", "pref_name", "molecule_structures"]
+        molecule = getChEMBLResource("molecule")
+        chunkSize = min(chunkSize, _MAX_REQUEST_IDS)
+        for ii in range(0, len(chemblIdList), chunkSize):
+            try:
+                tD = {tId: (None, None, None) for tId in chemblIdList[ii: ii + chunkSize]}
+                for mD in attachChEMBLSession(molecule.filter(molecule_chembl_id__in=chemblIdList[ii: ii + chunkSize]).only(atL)):
+                    tD[mD["molecule_chembl_id"]] = _moleculeSelect(mD)
+                rD.update(tD)
+            except Exception as e:
+                logger.exception("Failing for molecule chunk starting at %d with %s", ii, str(e))
+        return rD
+
+    def getMechanismDetails(self, chemblId):
         actionType = moa = maxPhase = None
         try:
-            atL = ["action_type", "mechanism_of_action", "max_phase"]
-            mechanism = new_client.mechanism  # pylint: disable=no-member
-            mechanism.set_format("json")
-            tD = mechanism.filter(molecule_chembl_id__exact=chemblId).only(atL)[0]
-            actionType = tD["action_type"] if tD and "action_type" in tD else None
-            moa = tD["mechanism_of_action"] if tD and "mechanism_of_action" in tD else None
-            maxPhase = tD["max_phase"] if tD and "max_phase" in tD else None
+            actionType, moa, maxPhase = _fetchMechanismDetails(chemblId)
         except Exception as e:
             logger.exception("Failing for %s with %s", chemblId, str(e))
         return actionType, moa, maxPhase
 
+    def getMechanismDetailsBatch(self, chemblIdList, chunkSize=50):
+        """Get mechanism details for the input list of ChEMBL molecule identifiers using batched requests.
+        The first mechanism record is selected for each molecule.
+
+        Args:
+            chemblIdList (list): list of ChEMBL molecule identifiers
+            chunkSize (int, optional): number of identifiers per request (default: 50, maximum: 50)
+
+        Returns:
+            dict: {chemblId: (actionType, moa, maxPhase), ...} (identifiers in failed requests are omitted)
+        """
+        rD = {}
+        atL = ["molecule_chembl_id", "action_type", "mechanism_of_action", "max_phase"]
+        mechanism = getChEMBLResource("mechanism")
+        chunkSize = min(chunkSize, _MAX_REQUEST_IDS)
+        for ii in range(0, len(chemblIdList), chunkSize):
+            try:
+                tD = {}
+                for mD in attachChEMBLSession(mechanism.filter(molecule_chembl_id__in=chemblIdList[ii: ii + chunkSize]).only(atL)):
+                    if mD["molecule_chembl_id"] not in tD:
+                        tD[mD["molecule_chembl_id"]] = _mechanismSelect(mD)
+                rD.update({tId: tD.get(tId, (None, None, None)) for tId in chemblIdList[ii: ii + chunkSize]})
+            except Exception as e:
+                logger.exception("Failing for mechanism chunk starting at %d with %s", ii, str(e))
+        return rD
+
 
 class ChEMBLTargetActivityProvider(StashableBase):
     """Accessors for ChEMBL target activity data."""
 
-    def __init__(self, cachePath, useCache):
+    def __init__(self, cachePath, useCache, **kwargs):
         #
         self.__cachePath = cachePath
+        self.__detailCacheMaxAgeDays = kwargs.get("detailCacheMaxAgeDays", 30)
+        self.__clearDetailCache = kwargs.get("clearDetailCache", False)
+        # ChEMBL release version (e.g., "34") if known, otherwise requested once when a fetch begins
+        self.__chemblVersion = kwargs.get("chemblVersion", None)
+        self.__loadKeysOnly = kwargs.get("loadKeysOnly", False)
+        self.__aKeyS = set()
+        self.__detailCacheD = None
         self.__dirName = "ChEMBL-target-activity"
         super(ChEMBLTargetActivityProvider, self).__init__(self.__cachePath, [self.__dirName])
         self.__dirPath = os.path.join(self.__cachePath, self.__dirName)
         self.__mU = MarshalUtil(workPath=self.__cachePath)
+        self.__worker = ChEMBLTargetActivityWorker()
         baseVersion = 33
         self.__version = baseVersion
-        logger.info("ChEMBL API MAX_LIMIT %r", Settings.Instance().MAX_LIMIT)  # pylint: disable=no-member
-        self.__aD, self.__allIdD = self.__reload(self.__dirPath, useCache)
+        logger.info("ChEMBL API MAX_LIMIT %r", _SETTINGS.MAX_LIMIT)  # pylint: disable=no-member
+        self.__aD, self.__allIdS = self.__reload(self.__dirPath, useCache, keysOnly=self.__loadKeysOnly)
 
     def testCache(self, minCount=1):
-        if self.__aD and (len(self.__aD) >= minCount):
-            logger.info("Activity data cached for (%d) targets", len(self.__aD))
+        numTargets = len(self.__aD) if self.__aD is not None else len(self.__aKeyS)
+        if numTargets and (numTargets >= minCount):
+            logger.info("Activity data cached for (%d) targets", numTargets)
             return True
         return False
 
@@ -148,66 +356,121 @@ class ChEMBLTargetActivityProvider(StashableBase):
         return self.__version
 
     def getTargetActivityDataPath(self):
-        return os.path.join(self.__dirPath, "chembl-target-activity-data.json")
+        return os.path.join(self.__dirPath, "chembl-target-activity-data.json.gz")
+
+    def __getPartialDataPath(self):
+        return os.path.join(self.__dirPath, "chembl-target-activity-data.partial.jsonl")
+
+    def __getDetailCachePath(self):
+        return os.path.join(self.__dirPath, "chembl-molecule-details.json")
+
+    def __getTargetIdDataPath(self):
+        return os.path.join(self.__dirPath, "chembl-target-activity-ids.json")
 
     def reload(self):
-        self.__aD, self.__allIdD = self.__reload(self.__dirPath, True)
+        self.__aD, self.__allIdS = self.__reload(self.__dirPath, True, keysOnly=self.__loadKeysOnly)
+
+    def __getActivityD(self):
+        """Return the activity data dictionary, completing a deferred (keys only) load if required."""
+        if self.__aD is None:
+            self.__aD, self.__allIdS = self.__reload(self.__dirPath, True)
+        return self.__aD
 
-    def __reload(self, dirPath, useCache):
+    def __reload(self, dirPath, useCache, keysOnly=False):
         startTime = time.time()
         aD = {}
-        allIdD = {}
+        allIdS = set()
         fU = FileUtil()
         fU.mkdir(dirPath)
+        self.__aKeyS = set()
+        targetIdFilePath = self.__getTargetIdDataPath()
+        if useCache and keysOnly and fU.exists(targetIdFilePath) and not fU.exists(self.__getPartialDataPath()):
+            # Defer reading the full activity data until activity records are requested
+            qD = fastJsonLoad(targetIdFilePath) or {}
+            self.__aKeyS = set(qD.get("activity_ids", []))
+            allIdS = set(qD.get("all_ids", []))
+            logger.info("Completed reload of target identifiers (%d activities) (%d tried identifiers) (%.4f seconds)", len(self.__aKeyS), len(allIdS), time.time() - startTime)
+            return None, allIdS
         targetActivityFilePath = self.getTargetActivityDataPath()
+        if not fU.exists(targetActivityFilePath) and fU.exists(targetActivityFilePath[:-3]):
+            # Uncompressed data file written by earlier versions
+            targetActivityFilePath = targetActivityFilePath[:-3]
         #
         if useCache and fU.exists(targetActivityFilePath):
             logger.info("useCache %r using %r", useCache, targetActivityFilePath)
-            qD = self.__mU.doImport(targetActivityFilePath, fmt="json")
-            aD = qD["activity"] if "activity" in qD else {}
-            idL = qD["all_ids"] if "all_ids" in qD else []
-            allIdD = {k: k in aD for k in idL}
+            qD, aD = fastJsonLoadStream(targetActivityFilePath, "activity")
+            aD = aD or {}
+            allIdS = set(qD.get("all_ids", [])) if qD else set()
+        #
+        partialFilePath = self.__getPartialDataPath()
+        if fU.exists(partialFilePath):
+            if useCache:
+                # Recover chunks checkpointed by an incomplete fetch
+                cDL = fastJsonLinesLoad(partialFilePath)
+                logger.info("Recovering (%d) checkpointed chunks from %r", len(cDL), partialFilePath)
+                for cD in cDL:
+                    aD.update(cD["activity"])
+                    allIdS.update(cD["all_ids"])
+            else:
+                fU.remove(partialFilePath)
+        #
+        self.__detailCacheD = None
+        # The molecule details cache is kept across rebuilds (see __getDetailCache())
+        if not useCache and fU.exists(targetIdFilePath):
+            fU.remove(targetIdFilePath)
+        if self.__clearDetailCache:
+            fU.remove(self.__getDetailCachePath())
+            self.__clearDetailCache = False
         #
         logger.info(
             "Completed reload (%d activities) (%d tried identifiers) at %s (%.4f seconds)",
             len(aD),
-            len(allIdD),
+            len(allIdS),
             time.strftime("%Y %m %d %H:%M:%S", time.localtime()),
             time.time() - startTime,
         )
         #
-        return aD, allIdD
+        return aD, allIdS
 
     def getTargetActivity(self, targetChEMBLId):
-        try:
-            return self.__aD[targetChEMBLId] if targetChEMBLId in self.__aD else []
-        except Exception:
-            return []
+        return self.__getActivityD().get(targetChEMBLId, [])
 
     def hasTargetActivity(self, targetChEMBLId):
-        try:
-            return targetChEMBLId in self.__aD
-        except Exception:
-            return False
+        return targetChEMBLId in self.__aD if self.__aD is not None else targetChEMBLId in self.__aKeyS
+
+    def getSequenceMatches(self, sequenceMatchFilePath):
+        """Get the sequence match results and the decoded query comments for the input sequence match file.
+        Results for the most recently read file are shared within the process.
+
+        Args:
+            sequenceMatchFilePath (str): sequence match output file path
+
+        Returns:
+            (dict, dict): {queryId: [match, ...], ...}, {queryId: {decoded query comment}, ...}
+
+        Raises:
+            ValueError: for a missing or empty sequence match file
+        """
+        if not os.path.exists(sequenceMatchFilePath):
+            raise ValueError("Missing sequence match file %r" % sequenceMatchFilePath)
+        return _loadSequenceMatches(sequenceMatchFilePath, os.path.getmtime(sequenceMatchFilePath))
+
+    def clearSequenceMatches(self):
+        """Release the shared sequence match results (e.g., once the cofactor list is built)."""
+        _loadSequenceMatches.cache_clear()
 
     def getTargetIdList(self, sequenceMatchFilePath):
         chemblIdList = []
         try:
-            mD = self.__mU.doImport(sequenceMatchFilePath, fmt="json")
-            # --- cofactor list
-            chemblIdList = []
-            for queryId in mD:
-                qCmtD = self.__decodeComment(queryId)
-                tS = qCmtD["chemblId"]
-                tL = tS.split(",")
-                chemblIdList.extend(tL)
-            chemblIdList = list(set(chemblIdList))
+            _, queryCmtD = self.getSequenceMatches(sequenceMatchFilePath)
+            # --- cofactor list (unique identifiers in first-seen order)
+            chemblIdList = list(dict.fromkeys(tId for qCmtD in queryCmtD.values() for tId in qCmtD["chemblId"].split(",")))
             logger.info("Total targets from sequence matching (%d)", len(chemblIdList))
         except Exception as e:
             logger.exception("Failing for %r with %s", sequenceMatchFilePath, str(e))
         return chemblIdList
 
-    def fetchTargetActivityData(self, targetChEMBLIdList, skip="none", maxActivity=10, chunkSize=50):
+    def fetchTargetActivityData(self, targetChEMBLIdList, skip="none", maxActivity=10, chunkSize=50, checkpointInterval=10):
         """Get cofactor activity data for the input ChEMBL target list.
 
         Args:
@@ -215,101 +478,128 @@ class ChEMBLTargetActivityProvider(StashableBase):
             skip (str, optional): Skip searching identifiers previously tried|matched|none (default: none)
             chunkSize (int, optional): ChEMBL API batch size for fetches (default: 50)
             maxActivity (int, optional): maximum number of activity records to return per target (default: 10)
+            checkpointInterval (int, optional): number of completed chunks between checkpoints (default: 10)
 
         Returns:
           bool:  True for success or False otherwise
 
         """
-        atL = [
-            "assay_chembl_id",
-            "assay_description",
-            "assay_type",
-            "canonical_smiles",
-            "ligand_efficiency",
-            "molecule_chembl_id",
-            "parent_molecule_chembl_id",
-            "pchembl_value",
-            "standard_relation",
-            "standard_type",
-            "standard_units",
-            "standard_value",
-            "target_chembl_id",
-        ]
         ok = False
-        targetD = self.__aD if self.__aD else {}
+        targetD = self.__getActivityD()
         logger.info("Fetching activities for starting target list (%d) skip option %r", len(targetChEMBLIdList), skip)
-        idList = []
-        allIdS = set()
-        if skip == "matched":
-            for tId in targetChEMBLIdList:
-                if tId in self.__aD:
-                    allIdS.add(tId)
-                    continue
-                idList.append(tId)
-        elif skip == "tried":
-            for tId in targetChEMBLIdList:
-                if tId in self.__allIdD:
-                    allIdS.add(tId)
-                    continue
-                idList.append(tId)
-        else:
-            idList = targetChEMBLIdList
+        idList, skipIdList = self.__selectTargetIds(targetChEMBLIdList, skip)
+        allIdS = set(skipIdList)
 
         numToProcess = len(idList)
         logger.info("Filtered target list (%d)", len(idList))
+        optD = {"attributeList": _ACTIVITY_ATTRIBUTES, "chunkSize": chunkSize, "maxActivity": maxActivity, "detailCache": self.__getDetailCache()}
+        doneIdL = []
         try:
             for ii in range(0, len(idList), chunkSize):
-                logger.info("Begin chunk at ii %d/%d", ii, numToProcess)
+                logger.debug("Begin chunk at ii %d/%d", ii, numToProcess)
                 try:
-                    act = new_client.activity  # pylint: disable=no-member
-                    act.set_format("json")
-                    actDL = (
-                        act.filter(target_chembl_id__in=idList[ii: ii + chunkSize])
-                        .filter(standard_type__in=["IC50", "Ki", "EC50", "Kd"])
-                        .filter(standard_value__isnull=False)
-                        .order_by("-standard_value")
-                        .only(atL)
-                    )
-                    logger.info("Results for index %d (%d)", ii, len(actDL))
-                    if actDL:
-                        for actD in actDL[:maxActivity] if maxActivity else actDL:
-                            actD = self.__activitySelect(atL, actD)
-                            actD["molecule_name"], actD["inchi_key"], _ = self.getMoleculeDetails(actD["molecule_chembl_id"])
-                            actD["action_type"], actD["moa"], actD["max_phase"] = self.getMechanismDetails(actD["molecule_chembl_id"])
-                            targetD.setdefault(actD["target_chembl_id"], []).append(actD)
+                    successList, retList, _, _ = self.__worker.fetchActivity(idList[ii: ii + chunkSize], "serial", optD, None)
+                    logger.debug("Results for index %d (%d)", ii, len(retList))
+                    targetD.update(self.__groupActivity(retList, {}))
                     #
-                    allIdS.update(set(idList))
+                    allIdS.update(successList)
+                    doneIdL.extend(successList)
                     #
-                    logger.info("Completed chunk starting at (%d)", ii)
-                    tS = datetime.datetime.now().isoformat()
-                    vS = datetime.datetime.now().strftime("%Y-%m-%d")
-                    ok = self.__mU.doExport(self.getTargetActivityDataPath(), {"version": vS, "created": tS, "activity": targetD, "all_ids": list(allIdS)}, fmt="json", indent=3)
-                    logger.info("Wrote completed chunk starting at (%d) (%r)", ii, ok)
+                    logger.debug("Completed chunk starting at (%d)", ii)
+                    if (ii // chunkSize + 1) % checkpointInterval == 0 or ii + chunkSize >= numToProcess:
+                        ok = self.__checkpoint(targetD, doneIdL)
+                        logger.info("Wrote checkpoint for chunks through (%d) total processed targets (%d/%d) (%r)", ii, min(ii + chunkSize, numToProcess), numToProcess, ok)
+                        doneIdL = []
                 #
                 except Exception as e:
                     logger.exception("Failing with chunk at index %d with %s", ii, str(e)[:200])
         #
         except Exception as e:
             logger.exception("Failing with %s", str(e))
+        if numToProcess:
+            ok = self.__consolidate(targetD, list(allIdS))
         return ok
 
-    def __activitySelect(self, atL, aD):
-        return {at: aD[at] if at in aD else None for at in atL}
+    def __selectTargetIds(self, targetChEMBLIdList, skip):
+        """Return the unique input target identifiers (order preserving) to be fetched and those skipped.
+
+        Args:
+            targetChEMBLIdList (list): list of ChEMBL target identifiers
+            skip (str): skip identifiers previously tried|matched|none
+
+        Returns:
+            (list, list): target identifiers to fetch, skipped target identifiers
+        """
+        targetChEMBLIdList = list(dict.fromkeys(targetChEMBLIdList))
+        if skip not in ["matched", "tried"]:
+            return targetChEMBLIdList, []
+        existing = self.__getActivityD().keys() if skip == "matched" else self.__allIdS
+        idList = [tId for tId in targetChEMBLIdList if tId not in existing]
+        skipIdList = [tId for tId in targetChEMBLIdList if tId in existing]
+        return idList, skipIdList
+
+    def __checkpoint(self, targetD, tIdList):
+        """Append the activity data for the input chunk of targets to the partial (JSONL) checkpoint file."""
+        cD = {tId: targetD[tId] for tId in tIdList if tId in targetD}
+        return fastJsonLinesAppend(self.__getPartialDataPath(), [{"activity": cD, "all_ids": tIdList}])
+
+    def __consolidate(self, targetD, allIdL):
+        """Write the complete activity data file and remove the partial checkpoint file."""
+        tS = datetime.datetime.now().isoformat()
+        vS = datetime.datetime.now().strftime("%Y-%m-%d")
+        ok = fastJsonDumpStream(self.getTargetActivityDataPath(), {"version": vS, "created": tS, "all_ids": allIdL}, "activity", targetD)
+        if ok:
+            ok = fastJsonDump(self.__getTargetIdDataPath(), {"version": vS, "created": tS, "activity_ids": list(targetD), "all_ids": allIdL})
+        for filePath in [self.__getPartialDataPath(), self.getTargetActivityDataPath()[:-3]]:
+            if ok and os.path.exists(filePath):
+                os.remove(filePath)
+        logger.info("Wrote activity data for (%d) targets (%r)", len(targetD), ok)
+        if self.__detailCacheD is not None:
+            self.__detailCacheD["updated"] = tS
+            okD = fastJsonDump(self.__getDetailCachePath(), self.__detailCacheD)
+            logger.info("Wrote molecule details for (%d) molecules (%r)", len(self.__detailCacheD["molecule"]), okD)
+        return ok
+
+    def __getChEMBLVersion(self):
+        """Return the ChEMBL release version (chemblVersion), requesting the ChEMBL status only once per instance."""
+        if self.__chemblVersion is None:
+            version, _ = self.getStatusDetails()
+            # An unavailable status service is not retried (the release check is then skipped)
+            self.__chemblVersion = version or ""
+        return self.__chemblVersion or None
+
+    def __getDetailCache(self):
+        """Return the molecule and mechanism details cache, reading the on-disk cache on first use.
+        This is only called by the fetch methods, so the ChEMBL release is only requested when a fetch runs.
+
+        The on-disk cache is kept across rebuilds (useCache=False).  Cached details older than the
+        maximum age (detailCacheMaxAgeDays) or from a different ChEMBL release than the one recorded
+        in the cache file are discarded, and the cache is removed on initialization with clearDetailCache=True.
+        """
+        if self.__detailCacheD is None:
+            detailCachePath = self.__getDetailCachePath()
+            dD = fastJsonLoad(detailCachePath) if os.path.exists(detailCachePath) else None
+            chemblVersion = self.__getChEMBLVersion()
+            if dD and "created" in dD:
+                ageDays = (datetime.datetime.now() - datetime.datetime.fromisoformat(dD["created"])).days
+                if ageDays > self.__detailCacheMaxAgeDays:
+                    logger.info("Discarding molecule details cache created %r (%d days)", dD["created"], ageDays)
+                    dD = None
+            if dD and chemblVersion and dD.get("chembl_version") and dD["chembl_version"] != chemblVersion:
+                logger.info("Discarding molecule details cache for ChEMBL version %r (current %r)", dD["chembl_version"], chemblVersion)
+                dD = None
+            if not dD:
+                dD = {"created": datetime.datetime.now().isoformat(), "molecule": {}, "mechanism": {}}
+            dD["chembl_version"] = dD.get("chembl_version") or chemblVersion
+            self.__detailCacheD = dD
+            logger.info("Molecule details cache (%d) mechanism details cache (%d)", len(dD["molecule"]), len(dD["mechanism"]))
+        return self.__detailCacheD
 
     def getMoleculeDetails(self, chemblId):
-        name = inchiKey = smiles = None
-        try:
-            atL = ["pref_name", "molecule_structures"]
-            molecule = new_client.molecule  # pylint: disable=no-member
-            molecule.set_format("json")
-            tD = molecule.filter(molecule_chembl_id__exact=chemblId).only(atL)[0]
-            name = tD["pref_name"] if tD and "pref_name" in tD else None
-            if tD and "molecule_structures" in tD and tD["molecule_structures"]:
-                smiles = tD["molecule_structures"]["canonical_smiles"] if tD and "molecule_structures" in tD and "canonical_smiles" in tD["molecule_structures"] else None
-                inchiKey = tD["molecule_structures"]["standard_inchi_key"] if tD and "molecule_structures" in tD and "standard_inchi_key" in tD["molecule_structures"] else None
-        except Exception as e:
-            logger.exception("Failing for %s with %s", chemblId, str(e))
-        return name, inchiKey, smiles
+        return self.__worker.getMoleculeDetails(chemblId)
+
+    def getMechanismDetails(self, chemblId):
+        return self.__worker.getMechanismDetails(chemblId)
 
     def getStatusDetails(self):
         try:
@@ -329,20 +619,6 @@ class ChEMBLTargetActivityProvider(StashableBase):
             logger.exception("Failing with %s", str(e))
         return version, releaseDateString
 
-    def getMechanismDetails(self, chemblId):
-        actionType = moa = maxPhase = None
-        try:
-            atL = ["action_type", "mechanism_of_action", "max_phase"]
-            mechanism = new_client.mechanism  # pylint: disable=no-member
-            mechanism.set_format("json")
-            tD = mechanism.filter(molecule_chembl_id__exact=chemblId).only(atL)[0]
-            actionType = tD["action_type"] if tD and "action_type" in tD else None
-            moa = tD["mechanism_of_action"] if tD and "mechanism_of_action" in tD else None
-            maxPhase = tD["max_phase"] if tD and "max_phase" in tD else None
-        except Exception as e:
-            logger.exception("Failing for %s with %s", chemblId, str(e))
-        return actionType, moa, maxPhase
-
     def fetchTargetActivityDataMulti(self, targetChEMBLIdList, skip="none", maxActivity=10, chunkSize=50, numProc=4):
         """Get cofactor activity data for the input ChEMBL target list (multiprocessing mode).
 
@@ -350,48 +626,23 @@ class ChEMBLTargetActivityProvider(StashableBase):
             targetChEMBLIdList (list): list of ChEMBL target identifiers
             skip (str, optional): Skip searching identifiers previously tried|matched|none (default: none).
                                   To rebuild ChEMBL-target-activity data from scratch (non-incremental), set to None.
-            chunkSize(int, optional): ChEMBL API outer batch size for fetches (default: 50)
-            numProc (int, optional): number processes to invoke. (default: 4)
+            chunkSize(int, optional): number of targets per checkpointed outer batch (default: 50).
+                                      Set to None for batches of 20 tasks per process.
+            numProc (int, optional): number processes to invoke (default: 4).  Set to None to use min(16, number of CPUs)
+                                     processes (i.e., up to 16 concurrent ChEMBL API clients).
             maxActivity (int, optional): number of activity records to return per target. (default: 10)
 
         Returns:
           bool:  True for success or False otherwise
 
         """
-        atL = [
-            "assay_chembl_id",
-            "assay_description",
-            "assay_type",
-            "canonical_smiles",
-            "ligand_efficiency",
-            "molecule_chembl_id",
-            "parent_molecule_chembl_id",
-            "pchembl_value",
-            "standard_relation",
-            "standard_type",
-            "standard_units",
-            "standard_value",
-            "target_chembl_id",
-        ]
+        numProc = numProc if numProc else min(16, os.cpu_count() or 1)
+        # Each process task fetches 5 targets, so outer batches are sized to keep all processes busy
+        chunkSize = chunkSize if chunkSize else numProc * 5 * 20
         logger.info("Fetching activities for starting target list (%d) skip option %r", len(targetChEMBLIdList), skip)
         ok = False
-        targetD = self.__aD if self.__aD else {}
-        idList = []
-        allIdL = []
-        if skip == "matched":
-            for tId in targetChEMBLIdList:
-                if tId in self.__aD:
-                    allIdL.append(tId)
-                    continue
-                idList.append(tId)
-        elif skip == "tried":
-            for tId in targetChEMBLIdList:
-                if tId in self.__allIdD:
-                    allIdL.append(tId)
-                    continue
-                idList.append(tId)
-        else:
-            idList = targetChEMBLIdList
+        targetD = self.__getActivityD()
+        idList, allIdL = self.__selectTargetIds(targetChEMBLIdList, skip)
 
         numToProcess = len(idList)
         tmpIdL = []
@@ -402,44 +653,109 @@ class ChEMBLTargetActivityProvider(StashableBase):
                 logger.info("Begin outer chunk at ii %d (total targets %d)", ii, numToProcess)
                 tIdList = idList[ii: ii + chunkSize]
                 #
-                tD = self.__getActivityMulti(tIdList, atL, maxActivity=maxActivity, numProc=numProc, chunkSize=5)
+                tD, failS = self.__getActivityMulti(tIdList, _ACTIVITY_ATTRIBUTES, maxActivity=maxActivity, numProc=numProc, chunkSize=5)
                 targetD.update(tD)
                 #
+                tIdList = [tId for tId in tIdList if tId not in failS]
                 tmpIdL.extend(tIdList)
                 allIdL.extend(tIdList)
                 #
                 logger.info("Completed outer chunk (%d) total processed targets (%d/%d)", ii, len(tmpIdL), numToProcess)
-                tS = datetime.datetime.now().isoformat()
-                vS = datetime.datetime.now().strftime("%Y-%m-%d")
-                ok = self.__mU.doExport(self.getTargetActivityDataPath(), {"version": vS, "created": tS, "activity": targetD, "all_ids": allIdL}, fmt="json", indent=3)
+                ok = self.__checkpoint(targetD, tIdList)
                 logger.info("Wrote completed outer chunk starting at (%d) (%r)", ii, ok)
         except Exception as e:
             logger.exception("Failing with %s", str(e))
+        if numToProcess:
+            ok = self.__consolidate(targetD, allIdL)
+        return ok
+
+    def fetchTargetActivityDataThreaded(self, targetChEMBLIdList, skip="none", maxActivity=10, chunkSize=5, numThreads=32, checkpointInterval=10):
+        """Get cofactor activity data for the input ChEMBL target list (multithreaded mode).
+
+        The ChEMBL API requests are I/O bound, so chunks of targets are fetched concurrently
+        in a thread pool sharing a single pooled HTTP session and molecule details cache.
+
+        Args:
+            targetChEMBLIdList (list): list of ChEMBL target identifiers
+            skip (str, optional): Skip searching identifiers previously tried|matched|none (default: none)
+            maxActivity (int, optional): number of activity records to return per target. (default: 10)
+            chunkSize (int, optional): number of targets fetched by each task (default: 5)
+            numThreads (int, optional): number of concurrent fetch threads (default: 32)
+            checkpointInterval (int, optional): number of completed tasks between checkpoints (default: 10)
+
+        Returns:
+          bool:  True for success or False otherwise
+
+        """
+        logger.info("Fetching activities for starting target list (%d) skip option %r", len(targetChEMBLIdList), skip)
+        targetD = self.__getActivityD()
+        idList, allIdL = self.__selectTargetIds(targetChEMBLIdList, skip)
+        #
+        numToProcess = len(idList)
+        logger.info("Filtered target list (%d) (skipping %d)", numToProcess, len(allIdL))
+        ok = numToProcess == 0
+        # Tasks are already concurrent, so detail requests within each task are issued serially
+        optD = {"attributeList": _ACTIVITY_ATTRIBUTES, "chunkSize": chunkSize, "maxActivity": maxActivity, "detailCache": self.__getDetailCache(), "numDetailThreads": 1}
+        try:
+            with ThreadPoolExecutor(max_workers=numThreads) as executor:
+                futureD = {}
+                for ii in range(0, numToProcess, chunkSize):
+                    tIdList = idList[ii: ii + chunkSize]
+                    futureD[executor.submit(self.__worker.fetchActivity, tIdList, "thread-%d" % ii, optD, None)] = tIdList
+                doneIdL = []
+                for numDone, future in enumerate(as_completed(futureD), 1):
+                    tIdList = futureD[future]
+                    try:
+                        # Targets in failed requests are excluded from the tried identifiers and retried on the next fetch
+                        successList, retList, _, _ = future.result()
+                        targetD.update(self.__groupActivity(retList, {}))
+                        doneIdL.extend(successList)
+                        allIdL.extend(successList)
+                    except Exception as e:
+                        logger.exception("Failing for targets %r with %s", tIdList, str(e)[:200])
+                    if doneIdL and (numDone % checkpointInterval == 0 or numDone == len(futureD)):
+                        ok = self.__checkpoint(targetD, doneIdL)
+                        logger.info("Checkpoint after (%d/%d) tasks total processed targets (%d/%d) (%r)", numDone, len(futureD), len(allIdL), numToProcess, ok)
+                        doneIdL = []
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        if numToProcess:
+            ok = self.__consolidate(targetD, allIdL)
         return ok
 
     def __getActivityMulti(self, idList, atL, maxActivity=None, numProc=2, chunkSize=5):
         """ """
         rD = {}
-        ctaW = ChEMBLTargetActivityWorker()
         mpu = MultiProcUtil(verbose=True)
-        optD = {"attributeList": atL, "chunkSize": chunkSize, "maxActivity": maxActivity}
+        detailCacheD = self.__getDetailCache()
+        optD = {"attributeList": atL, "chunkSize": chunkSize, "maxActivity": maxActivity, "detailCache": detailCacheD}
         mpu.setOptions(optD)
-        mpu.set(workerObj=ctaW, workerMethod="fetchActivity")
-        ok, failList, resultList, _ = mpu.runMulti(dataList=idList, numProc=numProc, numResults=1, chunkSize=chunkSize)
+        mpu.set(workerObj=self.__worker, workerMethod="fetchActivity")
+        # Workers return activity results through JSONL shard files rather than pickled lists
+        shardDirPath = os.path.join(self.__dirPath, "activity-shards")
+        fU = FileUtil()
+        fU.remove(shardDirPath)
+        fU.mkdir(shardDirPath)
+        mpu.setWorkingDir(shardDirPath)
+        ok, failList, resultList, _ = mpu.runMulti(dataList=idList, numProc=numProc, numResults=2, chunkSize=chunkSize)
         if failList:
             logger.info("Target Id activity failures (%d): %r", len(failList), failList)
         #
-        for (targetId, actD) in resultList[0]:
-            rD.setdefault(targetId, []).append(actD)
+        for shardPath in sorted(set(resultList[0])):
+            self.__groupActivity(fastJsonLinesLoad(shardPath), rD)
+        fU.remove(shardDirPath)
+        # Merge the details fetched by each worker process into the shared cache
+        for (detailType, chemblId, detailL) in resultList[1]:
+            detailCacheD[detailType][chemblId] = detailL
         #
         logger.info("Completed with multi-proc status %r failures %r total targets with data (%d)", ok, len(failList), len(rD))
-        return rD
-
-    def __decodeComment(self, comment, separator="|"):
-        dD = {}
-        try:
-            ti = iter(comment.split(separator))
-            dD = {tup[1]: tup[0] for tup in zip(ti, ti)}
-        except Exception:
-            pass
-        return dD
+        return rD, set(failList)
+
+    def __groupActivity(self, retList, targetD):
+        """Append the (targetId, activity record) results to the per-target lists in targetD."""
+        for targetId, actD in retList:
+            actL = targetD.get(targetId)
+            if actL is None:
+                actL = targetD[targetId] = []
+            actL.append(actD)
+        return targetD
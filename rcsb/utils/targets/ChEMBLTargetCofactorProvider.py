@@ -4,14 +4,29 @@
 #
 #  Updated:
 #  20-Aug-2024 dwp Add support for loading and accessing data on MongoDB
+#  16-Oct-2026 dwp Use orjson (when available) to read and write the cofactor data file
+#  16-Oct-2026 dwp Build and select the activity records once per ChEMBL target rather than once per matched entity
+#  16-Oct-2026 dwp Share the parsed sequence match results with ChEMBLTargetActivityProvider
+#  16-Oct-2026 dwp Select the top unmapped activity records with heapq.nlargest
+#  16-Oct-2026 dwp Decode matched entity identifiers and ligand neighbors once per query
+#  16-Oct-2026 dwp Memoize the decoded matched entity identifiers
+#  16-Oct-2026 dwp Keep the ligand neighbor chemical components in a set
+#  16-Oct-2026 dwp Accept an existing ChEMBLTargetProvider instance in buildCofactorList() and memoize target descriptions
+#  16-Oct-2026 dwp Write and read the cofactor data file one entity at a time
+#  16-Oct-2026 dwp Hoist the binding/functional assay type filter to a module-level frozenset
+#  16-Oct-2026 dwp Validate activity records explicitly rather than with a per-record try/except
+#  16-Oct-2026 dwp Skip the build for a missing or empty sequence match file and release the shared matches afterwards
 ##
 """
 Accessors for ChEMBL target cofactors.
 """
 
 import datetime
+import functools
+import heapq
 import logging
 import math
+import operator
 import os.path
 import time
 
@@ -20,10 +35,23 @@ from rcsb.utils.io.MarshalUtil import MarshalUtil
 from rcsb.utils.io.StashableBase import StashableBase
 from rcsb.utils.targets.ChEMBLTargetActivityProvider import ChEMBLTargetActivityProvider
 from rcsb.utils.targets.ChEMBLTargetProvider import ChEMBLTargetProvider
+from rcsb.utils.targets.FastJsonUtil import fastJsonDumpStream, fastJsonLoadStream
 from rcsb.utils.targets.TargetCofactorDbProvider import TargetCofactorDbProvider
 
 logger = logging.getLogger(__name__)
 
+_MEASUREMENT_KEY = operator.itemgetter("measurement_value")
+# Binding and functional assay types
+_ASSAY_TYPE_BF = frozenset(("B", "F"))
+
+
+@functools.lru_cache(maxsize=200000)
+def _decodeEntityId(comment, separator="|"):
+    """Return the (memoized) entry and entity identifiers from the entityId field of the input sequence match comment."""
+    ti = iter(comment.split(separator))
+    entryId, entityId = {tup[1]: tup[0] for tup in zip(ti, ti)}["entityId"].split("_")[:2]
+    return entryId, entityId
+
 
 class ChEMBLTargetCofactorProvider(StashableBase):
     """Accessors for ChEMBL target cofactors."""
@@ -72,7 +100,10 @@ class ChEMBLTargetCofactorProvider(StashableBase):
         #
         logger.info("useCache %r cofactorPath %r", useCache, cofactorPath)
         if useCache and self.__mU.exists(cofactorPath):
-            fD = self.__mU.doImport(cofactorPath, fmt="json")
+            hD, cD = fastJsonLoadStream(cofactorPath, "cofactors")
+            if hD is not None:
+                fD = hD
+                fD["cofactors"] = cD
             ok = len(fD) > 0
         else:
             fU = FileUtil()
@@ -84,7 +115,7 @@ class ChEMBLTargetCofactorProvider(StashableBase):
     def getCofactorDataDict(self):
         return self.__fD["cofactors"]
 
-    def buildCofactorList(self, sequenceMatchFilePath, crmpObj=None, lnmpObj=None, maxActivity=5):
+    def buildCofactorList(self, sequenceMatchFilePath, crmpObj=None, lnmpObj=None, maxActivity=5, chtpObj=None):
         """Build target cofactor list for the matching entities in the input sequence match file.
 
         Args:
@@ -92,6 +123,7 @@ class ChEMBLTargetCofactorProvider(StashableBase):
             crmpObj (obj, optional): instance of ChemRefMappingProviderObj()
             lnmpObj (obj, optional): instance of LigandNeighborMappingProviderObj(). Defaults to None.
             maxActivity (int, optional): maximum number of prioritized activity records per target
+            chtpObj (obj, optional): instance of ChEMBLTargetProvider() (default: a newly fetched instance)
 
         Returns:
             bool: True for success or False otherwise
@@ -120,10 +152,11 @@ class ChEMBLTargetCofactorProvider(StashableBase):
                         "target_chembl_id": "CHEMBL3243"
                     },
         """
-        rDL = []
-        mD = self.__mU.doImport(sequenceMatchFilePath, fmt="json")
+        # Cofactor records grouped by entity identifier
+        qD = {}
         #
-        chP = ChEMBLTargetProvider(cachePath=self.__cachePath, useCache=False)
+        # A fresh fetch also determines the current ChEMBL version used as the assignment version
+        chP = chtpObj if chtpObj else ChEMBLTargetProvider(cachePath=self.__cachePath, useCache=False)
         if not chP.testCache():
             logger.warning("Skipping build of target cofactor list because ChEMBL Target data is missing.")
             return False
@@ -132,70 +165,48 @@ class ChEMBLTargetCofactorProvider(StashableBase):
         if not chaP.testCache():
             logger.warning("Skipping build of target cofactor list because ChEMBL Target Activity data is missing.")
             return False
+        try:
+            mD, queryCmtD = chaP.getSequenceMatches(sequenceMatchFilePath)
+        except ValueError as e:
+            logger.error("Skipping build of target cofactor list with %s", str(e))
+            return False
         #
         provenanceSource = "ChEMBL"
         refScheme = "PDB entity"
         assignVersion = chP.getAssignmentVersion()
+        getTargetDescription = functools.lru_cache(maxsize=None)(chP.getTargetDescription)
         for queryId, matchDL in mD.items():
-            qCmtD = self.__decodeComment(queryId)
+            qCmtD = queryCmtD[queryId]
             unpId = qCmtD["uniprotId"]
-            queryTaxId = qCmtD["taxId"] if "taxId" in qCmtD else None
+            queryTaxId = qCmtD.get("taxId")
             chemblIdL = qCmtD["chemblId"].split(",")
             if queryTaxId == "-1":
                 logger.info("Skipping target with missing taxonomy %r (%r)", unpId, chemblIdL)
                 continue
-            queryName = chP.getTargetDescription(unpId)
+            queryName = getTargetDescription(unpId)
+            # Matched entity identifiers and ligand neighbors are the same for each ChEMBL target of the query
+            matchEntityL = []
+            for matchD in matchDL:
+                entryId, entityId = _decodeEntityId(matchD["target"])
+                matchEntityL.append((matchD, entryId, entityId))
+            chemCompNeighborS = set()
+            if lnmpObj:
+                for _, entryId, entityId in matchEntityL:
+                    chemCompNeighborS.update(lnmpObj.getLigandNeighbors(entryId + "_" + entityId))
             for chemblId in chemblIdL:
                 if not chaP.hasTargetActivity(chemblId):
                     logger.debug("Skipping target %r (%r)", unpId, chemblId)
                     # continue
                 # --
-                chemCompNeighborsD = {}
-                if lnmpObj:
-                    for matchD in matchDL:
-                        tCmtD = self.__decodeComment(matchD["target"])
-                        entryId = tCmtD["entityId"].split("_")[0]
-                        entityId = tCmtD["entityId"].split("_")[1]
-                        rcsbEntityId = entryId + "_" + entityId
-                        chemCompIdList = lnmpObj.getLigandNeighbors(rcsbEntityId)
-                        chemCompNeighborsD.update({k: True for k in chemCompIdList})
+                # Activity records depend only on the ChEMBL target, so these are built and selected once for all matched entities
+                taDL = chaP.getTargetActivity(chemblId)
+                logger.debug("Target %r has (%d) activity records", chemblId, len(taDL))
+                actL = self.__buildActivityList(taDL, crmpObj=crmpObj)
+                actL = self.__activityListSelect(actL, chemCompNeighborS, maxActivity=maxActivity)
+                if not actL:
+                    logger.debug("No ChEMBL cofactors for %s %s", chemblId, unpId)
                 # --
-                for matchD in matchDL:
-                    tCmtD = self.__decodeComment(matchD["target"])
-                    entryId = tCmtD["entityId"].split("_")[0]
-                    entityId = tCmtD["entityId"].split("_")[1]
-                    #
-                    taDL = chaP.getTargetActivity(chemblId)
-                    logger.debug("Target %r has (%d) activity records", chemblId, len(taDL))
-                    # ---
-                    actL = []
-                    for taD in taDL:
-                        if taD["assay_type"] in ["B", "F"]:
-                            try:
-                                if taD["standard_units"] == "nM" and taD["standard_value"] and float(taD["standard_value"]) > 0.0:
-                                    pV = -math.log10(float(taD["standard_value"]) * 10.0e-9)
-                                    actD = {
-                                        "cofactor_id": taD["molecule_chembl_id"],
-                                        "assay_id": taD["assay_chembl_id"],
-                                        "assay_description": taD["assay_description"],
-                                        "measurement_type": "p" + taD["standard_type"],
-                                        "measurement_value": round(pV, 2),
-                                        "smiles": taD["canonical_smiles"],
-                                        "molecule_name": taD["molecule_name"],
-                                        "inchi_key": taD["inchi_key"],
-                                        "action": taD["action"],
-                                        "moa": taD["moa"],
-                                        "max_phase": taD["max_phase"],
-                                    }
-                                    actD = self.__addLocalIds(actD, crmpObj=crmpObj)
-                                    actL.append(actD)
-                            except Exception as e:
-                                logger.debug("Failing for tAD %r with %s", taD, str(e))
-
-                    # ---
-                    actL = self.__activityListSelect(actL, chemCompNeighborsD, maxActivity=maxActivity)
-                    if not actL:
-                        logger.debug("No ChEMBL cofactors for %s %s", chemblId, unpId)
+                for matchD, entryId, entityId in matchEntityL:
                     # ---
                     # aligned_target.entity_beg_seq_id (current target is PDB entity in json)
                     # aligned_target.target_beg_seq_id (current query is target seq in json)
@@ -234,18 +245,14 @@ class ChEMBLTargetCofactorProvider(StashableBase):
                         #
                         "aligned_target": fpL,
                         #
-                        "taxonomy_match_status": matchD["taxonomyMatchStatus"] if "taxonomyMatchStatus" in matchD else None,
-                        "lca_taxonomy_id": matchD["lcaTaxId"] if "lcaTaxId" in matchD else None,
-                        "lca_taxonomy_name": matchD["lcaTaxName"] if "lcaTaxName" in matchD else None,
-                        "lca_taxonomy_rank": matchD["lcaRank"] if "lcaRank" in matchD else None,
-                        "cofactors": actL,
+                        "taxonomy_match_status": matchD.get("taxonomyMatchStatus"),
+                        "lca_taxonomy_id": matchD.get("lcaTaxId"),
+                        "lca_taxonomy_name": matchD.get("lcaTaxName"),
+                        "lca_taxonomy_rank": matchD.get("lcaRank"),
+                        "cofactors": list(actL),
                     }
-                    rDL.append(rD)
+                    qD.setdefault(entryId + "_" + entityId, []).append(rD)
             #
-        qD = {}
-        for rD in rDL:
-            eId = rD["entry_id"] + "_" + rD["entity_id"]
-            qD.setdefault(eId, []).append(rD)
         #
         tS = datetime.datetime.now().isoformat()
         # vS = datetime.datetime.now().strftime("%Y-%m-%d")
@@ -253,10 +260,43 @@ class ChEMBLTargetCofactorProvider(StashableBase):
         #
         # Write out cofactor data set
         fp = self.__getCofactorDataPath()
-        ok = self.__mU.doExport(fp, {"version": vS, "created": tS, "cofactors": qD}, fmt="json", indent=3)
+        ok = fastJsonDumpStream(fp, {"version": vS, "created": tS}, "cofactors", qD)
+        chaP.clearSequenceMatches()
         #
         return ok
 
+    def __buildActivityList(self, taDL, crmpObj=None):
+        """Convert ChEMBL activity records (binding and functional assays with nM values) to cofactor records."""
+        actL = []
+        log10 = math.log10
+        for taD in taDL:
+            if taD.get("assay_type") not in _ASSAY_TYPE_BF or taD.get("standard_units") != "nM" or not taD.get("standard_value") or taD.get("standard_type") is None:
+                continue
+            try:
+                value = float(taD["standard_value"])
+            except (TypeError, ValueError):
+                logger.debug("Skipping %r %r with standard value %r", taD.get("assay_chembl_id"), taD.get("molecule_chembl_id"), taD["standard_value"])
+                continue
+            if value <= 0.0:
+                continue
+            pV = -log10(value * 10.0e-9)
+            actD = {
+                "cofactor_id": taD.get("molecule_chembl_id"),
+                "assay_id": taD.get("assay_chembl_id"),
+                "assay_description": taD.get("assay_description"),
+                "measurement_type": "p" + taD["standard_type"],
+                "measurement_value": round(pV, 2),
+                "smiles": taD.get("canonical_smiles"),
+                "molecule_name": taD.get("molecule_name"),
+                "inchi_key": taD.get("inchi_key"),
+                "action": taD.get("action"),
+                "moa": taD.get("moa"),
+                "max_phase": taD.get("max_phase"),
+            }
+            actD = self.__addLocalIds(actD, crmpObj=crmpObj)
+            actL.append(actD)
+        return actL
+
     def __addLocalIds(self, cfD, crmpObj=None):
         #
         if crmpObj:
@@ -269,16 +309,16 @@ class ChEMBLTargetCofactorProvider(StashableBase):
                     cfD["chem_comp_id"] = localId
         return cfD
 
-    def __activityListSelect(self, activityDL, chemCompNeighborsD, maxActivity=5):
+    def __activityListSelect(self, activityDL, chemCompNeighborS, maxActivity=5):
         retL = []
         mappedNeighborL = []
         unmappedL = activityDL
         #
-        if chemCompNeighborsD:
+        if chemCompNeighborS:
             unmappedL = []
             # Select out the any cases for molecules that map to a neighbor chemical component.
             for activityD in activityDL:
-                if "chem_comp_id" in activityD and activityD["chem_comp_id"] in chemCompNeighborsD:
+                if activityD.get("chem_comp_id") in chemCompNeighborS:
                     activityD["neighbor_in_pdb"] = "Y"
                     mappedNeighborL.append(activityD)
                 else:
@@ -287,24 +327,14 @@ class ChEMBLTargetCofactorProvider(StashableBase):
         #
         numLeft = maxActivity - len(mappedNeighborL)
         if numLeft > 0:
-            unmappedL = sorted(unmappedL, key=lambda k: k["measurement_value"], reverse=True)
             retL = mappedNeighborL
-            retL.extend(unmappedL[:numLeft])
-            retL = sorted(retL, key=lambda k: k["measurement_value"], reverse=True)
+            retL.extend(heapq.nlargest(numLeft, unmappedL, key=_MEASUREMENT_KEY))
+            retL.sort(key=_MEASUREMENT_KEY, reverse=True)
         else:
             logger.debug("Mapped neighbor cofactors (%d) excluded unmapped (%d)", len(mappedNeighborL), len(unmappedL))
-            retL = sorted(mappedNeighborL, key=lambda k: k["measurement_value"], reverse=True)
+            retL = sorted(mappedNeighborL, key=_MEASUREMENT_KEY, reverse=True)
         return retL
 
-    def __decodeComment(self, comment, separator="|"):
-        dD = {}
-        try:
-            ti = iter(comment.split(separator))
-            dD = {tup[1]: tup[0] for tup in zip(ti, ti)}
-        except Exception:
-            pass
-        return dD
-
     def loadCofactorData(self, cfgOb, **kwargs):
         """Load cofactor data to MongoDB.
         """
@@ -5,6 +5,11 @@
 #  Updated:
 #   9-Feb-2023 aae  Update ChEMBL baseVersion to 31
 #  18-Jul-2023 dwp  Update ChEMBL baseVersion to 33
+#  16-Oct-2026 dwp  Reuse the pooled ChEMBL HTTP session for mechanism and activity requests
+#  16-Oct-2026 dwp  Checkpoint fetched chunks to an append-only JSONL file and write the full mechanism data file once
+#  16-Oct-2026 dwp  Reuse the shared ChEMBL client resource handles
+#  16-Oct-2026 dwp  Fetch mechanism chunks concurrently in a thread pool
+#  16-Oct-2026 dwp  Drop duplicate target identifiers before batching
 ##
 """
 Accessors for ChEMBL target mechanism data.
@@ -15,22 +20,20 @@ import datetime
 import logging
 import os.path
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from chembl_webresource_client.settings import Settings
 
-# pylint: disable=ungrouped-imports
-try:
-    from chembl_webresource_client.new_client import new_client  # fails when service is down
-except Exception:
-    pass
-
 from rcsb.utils.io.FileUtil import FileUtil
 from rcsb.utils.io.MarshalUtil import MarshalUtil
 from rcsb.utils.io.StashableBase import StashableBase
+from rcsb.utils.targets.ChEMBLSessionUtil import attachChEMBLSession, getChEMBLResource
+from rcsb.utils.targets.FastJsonUtil import fastJsonDump, fastJsonLinesAppend, fastJsonLinesLoad, fastJsonLoad
 
 
-Settings.Instance().TIMEOUT = 10  # pylint: disable=no-member
-Settings.Instance().MAX_LIMIT = 50  # pylint: disable=no-member
+_SETTINGS = Settings.Instance()
+_SETTINGS.TIMEOUT = 10  # pylint: disable=no-member
+_SETTINGS.MAX_LIMIT = 50  # pylint: disable=no-member
 Settings.MAX_LIMIT = 50
 
 logger = logging.getLogger(__name__)
@@ -48,7 +51,7 @@ class ChEMBLTargetMechanismProvider(StashableBase):
         self.__mU = MarshalUtil(workPath=self.__cachePath)
         baseVersion = 33
         self.__version = baseVersion
-        logger.info("ChEMBL API MAX_LIMIT %r", Settings.Instance().MAX_LIMIT)  # pylint: disable=no-member
+        logger.info("ChEMBL API MAX_LIMIT %r", _SETTINGS.MAX_LIMIT)  # pylint: disable=no-member
         self.__aD = self.__reload(self.__dirPath, useCache)
 
     def testCache(self, minCount=1):
@@ -63,6 +66,9 @@ class ChEMBLTargetMechanismProvider(StashableBase):
     def getTargetMechanismDataPath(self):
         return os.path.join(self.__dirPath, "chembl-target-mechanism-data.json")
 
+    def __getPartialDataPath(self):
+        return os.path.join(self.__dirPath, "chembl-target-mechanism-data.partial.jsonl")
+
     def reload(self):
         self.__aD = self.__reload(self.__dirPath, useCache=True)
         return True
@@ -76,16 +82,27 @@ class ChEMBLTargetMechanismProvider(StashableBase):
         #
         if useCache and fU.exists(targetMechanismFilePath):
             logger.info("useCache %r using %r", useCache, targetMechanismFilePath)
-            qD = self.__mU.doImport(targetMechanismFilePath, fmt="json")
+            qD = fastJsonLoad(targetMechanismFilePath) or {}
             aD = qD["mechanism"] if "mechanism" in qD else {}
         #
+        partialFilePath = self.__getPartialDataPath()
+        if fU.exists(partialFilePath):
+            if useCache:
+                # Recover chunks checkpointed by an incomplete fetch
+                cDL = fastJsonLinesLoad(partialFilePath)
+                logger.info("Recovering (%d) checkpointed chunks from %r", len(cDL), partialFilePath)
+                for cD in cDL:
+                    aD.update(cD["mechanism"])
+            else:
+                fU.remove(partialFilePath)
+        #
         logger.info("Completed reload of (%d) at %s (%.4f seconds)", len(aD), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), time.time() - startTime)
         #
         return aD
 
     def getTargetMechanisms(self, targetChEMBLId):
         try:
-            return self.__aD[targetChEMBLId] if targetChEMBLId in self.__aD else []
+            return self.__aD.get(targetChEMBLId, [])
         except Exception:
             return []
 
@@ -95,13 +112,15 @@ class ChEMBLTargetMechanismProvider(StashableBase):
         except Exception:
             return False
 
-    def fetchTargetMechanismData(self, targetChEMBLIdList, skipExisting=True, chunkSize=50):
+    def fetchTargetMechanismData(self, targetChEMBLIdList, skipExisting=True, chunkSize=50, checkpointInterval=10, numThreads=8):
         """Get cofactor mechanism data for the input ChEMBL target list.
 
         Args:
             targetChEMBLIdList (list): list of ChEMBL target identifiers
             skipExisting (bool, optional): reuse any existing cached data (default: True)
             chunkSize(int, optional): ChEMBL API batch size for fetches (default: 50)
+            checkpointInterval (int, optional): number of completed chunks between checkpoints (default: 10)
+            numThreads (int, optional): number of concurrent chunk requests (default: 8)
 
         Returns:
           bool:  True for success or False otherwise
@@ -116,38 +135,55 @@ class ChEMBLTargetMechanismProvider(StashableBase):
             "target_chembl_id",
         ]
         targetD = self.__aD if self.__aD else {}
-        idList = []
-        if skipExisting:
-            for tId in targetChEMBLIdList:
-                if tId in self.__aD:
-                    continue
-                idList.append(tId)
-        else:
-            idList = targetChEMBLIdList
+        idList = self.__selectTargetIds(targetChEMBLIdList, skipExisting)
 
         numToProcess = len(idList)
         logger.info("Fetching mechanism data for (%d/%d)", numToProcess, len(targetChEMBLIdList))
         ok = False
+        tIdList = []
         try:
-            for ii in range(0, len(idList), chunkSize):
-                logger.info("Begin chunk at ii %d/%d", ii, numToProcess)
-                mch = new_client.mechanism  # pylint: disable=no-member
-                mch.set_format("json")
-                mDL = mch.filter(target_chembl_id__in=idList[ii : ii + chunkSize]).only(atL)
-
-                logger.info("Results (%d)", len(mDL))
-                if mDL:
-                    for mD in mDL:
-                        targetD.setdefault(mD["target_chembl_id"], []).append(self.__mechanismSelect(atL, mD))
-                #
-                logger.info("Completed chunk starting at (%d)", ii)
-                tS = datetime.datetime.now().isoformat()
-                vS = datetime.datetime.now().strftime("%Y-%m-%d")
-                ok = self.__mU.doExport(self.getTargetMechanismDataPath(), {"version": vS, "created": tS, "mechanism": targetD}, fmt="json", indent=3)
-                logger.info("Wrote completed chunk starting at (%d) (%r)", ii, ok)
+            mch = getChEMBLResource("mechanism")
+            idChunkL = [idList[ii : ii + chunkSize] for ii in range(0, numToProcess, chunkSize)]
+            # Requests are I/O bound and are issued concurrently; results are merged on this thread
+            with ThreadPoolExecutor(max_workers=numThreads) as executor:
+                futureD = {executor.submit(self.__fetchMechanismChunk, mch, idChunk, atL): idChunk for idChunk in idChunkL}
+                for numDone, future in enumerate(as_completed(futureD), 1):
+                    idChunk = futureD[future]
+                    try:
+                        mDL = future.result()
+                        for mD in mDL:
+                            targetD.setdefault(mD["target_chembl_id"], []).append(self.__mechanismSelect(atL, mD))
+                        logger.info("Completed chunk (%d/%d) results (%d)", numDone, len(idChunkL), len(mDL))
+                        tIdList.extend(idChunk)
+                    except Exception as e:
+                        logger.exception("Failing for chunk %r with %s", idChunk, str(e)[:200])
+                    if tIdList and (numDone % checkpointInterval == 0 or numDone == len(idChunkL)):
+                        cD = {tId: targetD[tId] for tId in tIdList if tId in targetD}
+                        ok = fastJsonLinesAppend(self.__getPartialDataPath(), [{"mechanism": cD}])
+                        logger.info("Checkpoint after (%d/%d) chunks (%r)", numDone, len(idChunkL), ok)
+                        tIdList = []
         except Exception as e:
             logger.exception("Failing with %s", str(e))
+        if numToProcess:
+            tS = datetime.datetime.now().isoformat()
+            vS = datetime.datetime.now().strftime("%Y-%m-%d")
+            ok = fastJsonDump(self.getTargetMechanismDataPath(), {"version": vS, "created": tS, "mechanism": targetD})
+            if ok and os.path.exists(self.__getPartialDataPath()):
+                os.remove(self.__getPartialDataPath())
+            logger.info("Wrote mechanism data for (%d) targets (%r)", len(targetD), ok)
         return ok
 
+    def __selectTargetIds(self, targetChEMBLIdList, skipExisting):
+        """Return the unique input target identifiers (order preserving) to be fetched, optionally
+        skipping those with existing cached data.
+        """
+        targetChEMBLIdList = list(dict.fromkeys(targetChEMBLIdList))
+        if not skipExisting or not self.__aD:
+            return targetChEMBLIdList
+        return [tId for tId in targetChEMBLIdList if tId not in self.__aD]
+
+    def __fetchMechanismChunk(self, mch, idChunk, atL):
+        return list(attachChEMBLSession(mch.filter(target_chembl_id__in=idChunk).only(atL)))
+
     def __mechanismSelect(self, atL, aD):
-        return {at: aD[at] if at in aD else None for at in atL}
+        return {at: aD.get(at) for at in atL}
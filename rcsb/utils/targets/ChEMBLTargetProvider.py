@@ -5,29 +5,86 @@
 #  Updated:
 #   9-Feb-2023 aae  Update ChEMBL baseVersion to 31
 #  18-Jul-2023 dwp  Update ChEMBL baseVersion to 33
+#  16-Oct-2026 dwp  Reuse the pooled ChEMBL HTTP session for mechanism and activity requests
+#  16-Oct-2026 dwp  Reuse the shared ChEMBL client resource handles
+#  16-Oct-2026 dwp  Fetch activity and mechanism chunks concurrently in a thread pool
+#  16-Oct-2026 dwp  Parse FASTA header identifiers with str.partition
+#  16-Oct-2026 dwp  Locate the target FASTA version with HEAD requests before downloading
+#  16-Oct-2026 dwp  Stream the raw target FASTA file rather than loading it in full
+#  16-Oct-2026 dwp  Request only the retained activity attributes in getActivityData()
+#  16-Oct-2026 dwp  Drop duplicate target identifiers before batching
+#  16-Oct-2026 dwp  Probe the candidate target FASTA versions concurrently
+#  16-Oct-2026 dwp  Write the target FASTA file as the raw sequences are read
+#  16-Oct-2026 dwp  Look up the taxonomy once per UniProt identifier
+#  16-Oct-2026 dwp  Format the target record comments directly
+#  16-Oct-2026 dwp  Use orjson (when available) to read and write the UniProt mapping file
+#  16-Oct-2026 dwp  Read the UniProt mapping text file in a single pass
+#  16-Oct-2026 dwp  Remove the unused UniProt to ChEMBL id index built while exporting target sequences
+#  16-Oct-2026 dwp  Use dict.get() rather than try/except in the target accessors
+#  16-Oct-2026 dwp  Reuse the UniProt identifier mapping provider across target sequence exports by the same instance
+#  16-Oct-2026 dwp  Add a chunkSize option to the activity and mechanism fetches and split failing chunks
+#  16-Oct-2026 dwp  Add an on-disk cache of the activity and mechanism results keyed by target and ChEMBL version
+#  16-Oct-2026 dwp  Build the target FASTA paths and urls once
+#  16-Oct-2026 dwp  Record the fetched target FASTA version and check it first on the next fetch
+#  16-Oct-2026 dwp  Skip duplicate target records when writing the target FASTA file (the first record is kept)
+#  16-Oct-2026 dwp  Split only chunks rejected as too large (HTTP 400/414) and report other failing chunks
+#  16-Oct-2026 dwp  Make the activity and mechanism results cache optional (useResultCache) and cache only non-empty results
 ##
 """
 Accessors for ChEMBL target assignments.
 
 """
 
+import datetime
 import logging
 import os.path
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from rcsb.utils.io.FileUtil import FileUtil
 from rcsb.utils.io.MarshalUtil import MarshalUtil
 from rcsb.utils.seq.UniProtIdMappingProvider import UniProtIdMappingProvider
+from rcsb.utils.targets.ChEMBLSessionUtil import attachChEMBLSession, getChEMBLResource, getChEMBLSession
+from rcsb.utils.targets.FastJsonUtil import fastJsonDump, fastJsonLoad
+from rcsb.utils.targets.FastaStreamUtil import fastaIter, fastaWrite
 
 # pylint: disable=ungrouped-imports
 try:
-    from chembl_webresource_client.new_client import new_client  # fails when service is down
-except Exception:
-    pass
-
+    from chembl_webresource_client.http_errors import HttpBadRequest
+except ImportError:
+    HttpBadRequest = None
 
 logger = logging.getLogger(__name__)
 
+# Activity attributes requested from (and retained for) each ChEMBL activity record
+_ACTIVITY_ATTRIBUTES = [
+    "assay_chembl_id",
+    "assay_description",
+    "assay_type",
+    "canonical_smiles",
+    "ligand_efficiency",
+    "molecule_chembl_id",
+    "parent_molecule_chembl_id",
+    "pchembl_value",
+    "standard_relation",
+    "standard_type",
+    "standard_units",
+    "standard_value",
+    "target_chembl_id",
+]
+
+# HTTP status codes for requests rejected as too large (retried as smaller chunks)
+_SPLIT_STATUS_CODES = (400, 414)
+
+
+def _getHttpStatusCode(exc):
+    """Return the HTTP status code for a failed web service request (or None if not available)."""
+    statusCode = getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+    if statusCode is None and HttpBadRequest is not None and isinstance(exc, HttpBadRequest):
+        # chembl_webresource_client errors do not carry the status code
+        statusCode = 400
+    return statusCode
+
 
 class ChEMBLTargetProvider:
     """Accessors for ChEMBL target assignments."""
@@ -38,6 +95,11 @@ class ChEMBLTargetProvider:
         self.__dirPath = os.path.join(self.__cachePath, "ChEMBL-targets")
         baseVersion = 34
         self.__version = baseVersion
+        # Optional on-disk cache of the (non-empty) activity and mechanism web service results for each target
+        self.__useResultCache = kwargs.get("useResultCache", False)
+        self.__resultCacheMaxAgeDays = kwargs.get("resultCacheMaxAgeDays", 30)
+        self.__resultCacheD = {}
+        self.__umP = None
         self.__mapD = self.__reload(self.__dirPath, baseVersion, useCache, **kwargs)
         #
 
@@ -48,17 +110,15 @@ class ChEMBLTargetProvider:
         return self.__version
 
     def getTargetDescription(self, unpId):
-        try:
-            return self.__mapD[unpId][1]
-        except Exception:
+        tD = self.__mapD.get(unpId)
+        if tD is None:
             logger.error("Missing description for %r", unpId)
             return None
+        return tD[1]
 
     def getTargetChEMBLId(self, unpId):
-        try:
-            return self.__mapD[unpId][0]
-        except Exception:
-            return None
+        tD = self.__mapD.get(unpId)
+        return tD[0] if tD is not None else None
 
     def getTargetDataPath(self):
         return os.path.join(self.__dirPath, "chembl-target-data.json")
@@ -68,54 +128,114 @@ class ChEMBLTargetProvider:
 
     def __reload(self, dirPath, baseVersion, useCache, **kwargs):
         startTime = time.time()
-        mU = MarshalUtil(workPath=dirPath)
         chemblDbUrl = kwargs.get("ChEMBLDbUrl", "https://ftp.ebi.ac.uk/pub/databases/chembl/ChEMBLdb/latest/")
         ok = False
         fU = FileUtil()
         fU.mkdir(dirPath)
         #
         # ChEMBL current version <baseVersion>,...
-        # template:  chembl_<baseVersion>.fa.gz
         #
-        targetFileName = "chembl_" + str(baseVersion) + ".fa.gz"
         mappingFileName = "chembl_uniprot_mapping.txt"
         #
-        chemblTargetPath = os.path.join(dirPath, targetFileName)
+        chemblTargetPath = os.path.join(dirPath, "chembl_targets_raw.fa.gz")
         chemblMappingPath = os.path.join(dirPath, mappingFileName)
         mappingFilePath = os.path.join(dirPath, "chembl_uniprot_mapping.json")
+        # ChEMBL version of the most recently fetched target FASTA file
+        versionFilePath = os.path.join(dirPath, "chembl_target_version.json")
+        cachedVersion = (fastJsonLoad(versionFilePath) or {}).get("version") if fU.exists(versionFilePath) else None
         #
         mapD = {}
         if useCache and fU.exists(mappingFilePath):
             logger.info("useCache %r using %r and %r and %r", useCache, chemblTargetPath, chemblMappingPath, mappingFilePath)
-            mapD = mU.doImport(mappingFilePath, fmt="json")
+            mapD = fastJsonLoad(mappingFilePath) or {}
+            if cachedVersion:
+                self.__version = cachedVersion
         else:
             # Get the ChEMBL UniProt mapping file
             url = os.path.join(chemblDbUrl, mappingFileName)
             ok = fU.get(url, chemblMappingPath)
             logger.info("Fetched %r url %s path %s", ok, url, chemblMappingPath)
             logger.info("Reading ChEMBL mapping file path %s", mappingFilePath)
-            rowL = mU.doImport(chemblMappingPath, fmt="tdd", rowFormat="list")
-            for row in rowL:
-                mapD[row[0]] = (row[1], row[2], row[3])
-            ok = mU.doExport(mappingFilePath, mapD, fmt="json")
+            mapD = self.__readMappingFile(chemblMappingPath)
+            ok = fastJsonDump(mappingFilePath, mapD)
             logger.info("Processed mapping path %s (%d) %r", mappingFilePath, len(mapD), ok)
             #
             # Get the target FASTA files --
-            for vers in range(baseVersion, baseVersion + 10):
+            #  locate the current version with cheap HEAD requests before downloading (checking
+            #  the previously fetched version first)
+            if cachedVersion and cachedVersion >= baseVersion and self.__urlExists(self.__getTargetFastaUrl(chemblDbUrl, cachedVersion)):
+                logger.info("Found ChEMBL target FASTA version %r", cachedVersion)
+                versionL = [cachedVersion]
+            else:
+                versionL = self.__probeVersions(chemblDbUrl, list(range(baseVersion, baseVersion + 10)))
+            for vers in versionL:
                 logger.info("Now fetching version %r", vers)
                 self.__version = vers
-                targetFileName = "chembl_" + str(vers) + ".fa.gz"
-                chemblTargetPath = os.path.join(dirPath, "chembl_targets_raw.fa.gz")
-                url = os.path.join(chemblDbUrl, targetFileName)
+                url = self.__getTargetFastaUrl(chemblDbUrl, vers)
                 ok = fU.get(url, chemblTargetPath)
                 logger.info("Fetched %r url %s path %s", ok, url, chemblTargetPath)
                 if ok:
+                    fastJsonDump(versionFilePath, {"version": vers, "created": datetime.datetime.now().isoformat()})
                     break
         #
         logger.info("Completed reload at %s (%.4f seconds)", time.strftime("%Y %m %d %H:%M:%S", time.localtime()), time.time() - startTime)
         #
         return mapD
 
+    def __readMappingFile(self, filePath):
+        """Read the tab delimited ChEMBL UniProt mapping file as {UniProtId: (ChEMBLId, name, type)} in a single pass."""
+        mapD = {}
+        try:
+            with open(filePath, "r", encoding="utf-8") as ifh:
+                for line in ifh:
+                    if line.startswith("#"):
+                        continue
+                    fL = line.rstrip("\r\n").split("\t")
+                    if len(fL) >= 4:
+                        mapD[fL[0]] = (fL[1], fL[2], fL[3])
+        except Exception as e:
+            logger.exception("Failing for %r with %s", filePath, str(e))
+        return mapD
+
+    def __getTargetFastaUrl(self, chemblDbUrl, vers):
+        # template:  chembl_<version>.fa.gz
+        return "%s/chembl_%d.fa.gz" % (chemblDbUrl.rstrip("/"), vers)
+
+    def __probeVersions(self, chemblDbUrl, versionL, numThreads=10):
+        """Probe the candidate target FASTA versions concurrently with HEAD requests.
+
+        Returns:
+            list: the newest available version, or the input candidate versions if the probe is inconclusive
+        """
+        with ThreadPoolExecutor(max_workers=numThreads) as executor:
+            existsL = list(executor.map(lambda vers: self.__urlExists(self.__getTargetFastaUrl(chemblDbUrl, vers)), versionL))
+        foundL = [vers for vers, exists in zip(versionL, existsL) if exists]
+        if foundL:
+            logger.info("Found ChEMBL target FASTA version %r", foundL[-1])
+            return [foundL[-1]]
+        if None in existsL:
+            # HEAD is not supported - try each candidate download in turn
+            return versionL
+        logger.warning("No ChEMBL target FASTA version found in %r", versionL)
+        return []
+
+    def __urlExists(self, url, timeout=5):
+        """Check for the existence of the input url with a HEAD request.
+
+        Returns:
+            bool: True if the url exists, False if not found, or None if the check is inconclusive
+        """
+        try:
+            resp = getChEMBLSession().head(url, allow_redirects=True, timeout=timeout)
+            if resp.status_code == 200:
+                return True
+            if resp.status_code == 404:
+                return False
+            logger.info("HEAD request for %s returned status %r", url, resp.status_code)
+        except Exception as e:
+            logger.info("HEAD request for %s failing with %s", url, str(e))
+        return None
+
     def exportFasta(self, fastaPath, taxonPath, addTaxonomy=False):
         ok = self.__parseFasta(fastaPath, taxonPath, self.__cachePath, self.__dirPath, addTaxonomy=addTaxonomy)
         return ok
@@ -124,43 +244,14 @@ class ChEMBLTargetProvider:
         # input paths
         chemblTargetRawPath = os.path.join(dirPath, "chembl_targets_raw.fa.gz")
         mU = MarshalUtil(workPath=cachePath)
-        oD = {}
-        uD = {}
-        missTax = 0
         taxonL = []
         try:
+            umP = None
             if addTaxonomy:
-                umP = UniProtIdMappingProvider(cachePath)
-                umP.reload(useCache=True)
-            #
-            fD = mU.doImport(chemblTargetRawPath, fmt="fasta", commentStyle="default")
-            #
-            for seqId, sD in fD.items():
-                chemblId = seqId.strip().split(" ")[0].strip()
-                unpId = seqId[seqId.find("[") + 1 : seqId.find("]")]
-                seq = sD["sequence"]
-                cD = {"sequence": seq, "uniprotId": unpId, "chemblId": chemblId}
-                if addTaxonomy:
-                    taxId = umP.getMappedId(unpId, mapName="NCBI-taxon")
-                    cD["taxId"] = taxId if taxId else -1
-                    if not taxId:
-                        missTax += 1
-                #
-                seqId = ""
-                cL = []
-                for k, v in cD.items():
-                    if k in ["sequence"]:
-                        continue
-                    cL.append(str(v))
-                    cL.append(str(k))
-                seqId = "|".join(cL)
-                oD[seqId] = cD
-                if addTaxonomy:
-                    taxonL.append("%s\t%s" % (seqId, taxId))
-                #
-                uD.setdefault(unpId, []).append(chemblId)
+                umP = self.__getUniProtIdMappingProvider(cachePath)
             #
-            ok1 = mU.doExport(fastaPath, oD, fmt="fasta", makeComment=True)
+            # Target records are written as the raw sequences are read
+            ok1 = fastaWrite(fastaPath, self.__iterTargetRecords(chemblTargetRawPath, umP, taxonL))
             ok3 = True
             if addTaxonomy:
                 ok3 = mU.doExport(taxonPath, taxonL, fmt="list")
@@ -170,74 +261,205 @@ class ChEMBLTargetProvider:
         #
         return False
 
-    def getActivityData(self, targetChEMBLIdList):
-        """Get cofactor activity data for the input ChEMBL target list.
+    def __getUniProtIdMappingProvider(self, cachePath):
+        """Return the UniProt identifier mapping provider, loaded once and kept for the life of this instance."""
+        if self.__umP is None:
+            self.__umP = UniProtIdMappingProvider(cachePath)
+            self.__umP.reload(useCache=True)
+        return self.__umP
+
+    def __iterTargetRecords(self, chemblTargetRawPath, umP, taxonL):
+        """Yield the (comment, sequence) target records for the raw target sequences read one record at a time.
+        Only the first record for each output comment (e.g., duplicate ChEMBL/UniProt pairs) is retained.
+        """
+        missTax = 0
+        numDup = 0
+        # UniProt taxonomy lookups shared by the targets for each UniProt identifier
+        taxD = {}
+        seenS = set()
+        for seqId, seq in fastaIter(chemblTargetRawPath):
+            # e.g., CHEMBL3243 [P08575] Leukocyte common antigen
+            chemblId = seqId.strip().partition(" ")[0]
+            unpId = seqId.partition("[")[2].partition("]")[0]
+            # e.g., P08575|uniprotId|CHEMBL3243|chemblId|9606|taxId
+            seqId = "%s|uniprotId|%s|chemblId" % (unpId, chemblId)
+            if seqId in seenS:
+                numDup += 1
+                continue
+            seenS.add(seqId)
+            if umP:
+                if unpId not in taxD:
+                    taxD[unpId] = umP.getMappedId(unpId, mapName="NCBI-taxon")
+                taxId = taxD[unpId]
+                if not taxId:
+                    missTax += 1
+                seqId = "%s|%s|taxId" % (seqId, taxId if taxId else -1)
+                taxonL.append("%s\t%s" % (seqId, taxId))
+            yield seqId, seq
+        if numDup:
+            logger.info("Skipped (%d) duplicate target records", numDup)
+        if umP:
+            logger.info("Missing taxonomy for (%d) targets", missTax)
+
+    def getActivityData(self, targetChEMBLIdList, chunkSize=50, numThreads=8):
+        """Get cofactor activity data for the input ChEMBL target list.  With useResultCache=True,
+        non-empty results cached for the current ChEMBL version within resultCacheMaxAgeDays
+        (default: 30) are returned without a new request.
 
         Args:
             targetChEMBLIdList (list): list of ChEMBL target identifiers
+            chunkSize (int, optional): number of target identifiers per request (default: 50)
+            numThreads (int, optional): number of concurrent chunk requests (default: 8)
 
         Returns:
           (dict, dict):  {targetChEMBId: {activity data}}, {moleculeChEMBId: {activity data}}
 
         """
-        targetD = {}
-        chunkSize = 50
-        numTargets = len(targetChEMBLIdList)
+        targetChEMBLIdList = self.__selectTargetIds(targetChEMBLIdList)
+        targetD, idList = self.__getCachedResults("activity", targetChEMBLIdList)
+        numTargets = len(idList)
         try:
-            for ii in range(0, len(targetChEMBLIdList), chunkSize):
-                logger.info("Begin chunk ii %d/%d", ii, numTargets)
-                act = new_client.activity  # pylint: disable=no-member
-                act.set_format("json")
-                actDL = (
-                    act.filter(target_chembl_id__in=targetChEMBLIdList[ii : ii + chunkSize]).filter(standard_type__in=["IC50", "Ki", "EC50", "Kd"]).filter(standard_value__isnull=False)
-                )
-                if actDL:
-                    for actD in actDL:
-                        targetD.setdefault(actD["target_chembl_id"], []).append(self.__activitySelect(actD))
-                logger.info("End chunk completed (%d)", ii)
+            failS = set()
+            for ii, (idChunk, actDL) in enumerate(self.__fetchChunks(self.__activityQuery, idList, chunkSize=chunkSize, numThreads=numThreads)):
+                if actDL is None:
+                    failS.update(idChunk)
+                    continue
+                for actD in actDL:
+                    targetD.setdefault(actD["target_chembl_id"], []).append(self.__activitySelect(actD))
+                logger.info("End chunk completed (%d/%d) for (%d) targets", ii + 1, -(-numTargets // chunkSize), numTargets)
+            if failS:
+                logger.info("Activity requests failed for (%d/%d) targets", len(failS), numTargets)
+            self.__updateResultCache("activity", [tId for tId in idList if tId not in failS], targetD)
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         return targetD
 
+    def __selectTargetIds(self, targetChEMBLIdList):
+        """Return the unique input target identifiers (order preserving)."""
+        return list(dict.fromkeys(targetChEMBLIdList))
+
+    def __activityQuery(self, idChunk):
+        """Return the activity query set for the input chunk of target identifiers."""
+        return (
+            getChEMBLResource("activity")
+            .filter(target_chembl_id__in=idChunk)
+            .filter(standard_type__in=["IC50", "Ki", "EC50", "Kd"])
+            .filter(standard_value__isnull=False)
+            .only(_ACTIVITY_ATTRIBUTES)
+        )
+
+    def __mechanismQuery(self, idChunk):
+        """Return the mechanism query set for the input chunk of target identifiers."""
+        return getChEMBLResource("mechanism").filter(target_chembl_id__in=idChunk)
+
+    def __getResultCachePath(self, resultType):
+        return os.path.join(self.__dirPath, "chembl-target-%s-results.json" % resultType)
+
+    def __getResultCache(self, resultType):
+        """Return the cached web service results of the input type (activity|mechanism), reading the
+        on-disk cache on first use.  Cached results older than the maximum age (resultCacheMaxAgeDays)
+        or for a different ChEMBL version are discarded.
+        """
+        if resultType not in self.__resultCacheD:
+            cachePath = self.__getResultCachePath(resultType)
+            cD = fastJsonLoad(cachePath) if os.path.exists(cachePath) else None
+            if cD and "created" in cD:
+                ageDays = (datetime.datetime.now() - datetime.datetime.fromisoformat(cD["created"])).days
+                if ageDays > self.__resultCacheMaxAgeDays:
+                    logger.info("Discarding %s results cache created %r (%d days)", resultType, cD["created"], ageDays)
+                    cD = None
+            if cD and cD.get("version") != self.__version:
+                logger.info("Discarding %s results cache for ChEMBL version %r (current %r)", resultType, cD.get("version"), self.__version)
+                cD = None
+            if not cD:
+                cD = {"created": datetime.datetime.now().isoformat(), "version": self.__version, "targets": {}}
+            self.__resultCacheD[resultType] = cD
+        return self.__resultCacheD[resultType]
+
+    def __getCachedResults(self, resultType, targetChEMBLIdList):
+        """Return the cached results for the input targets and the list of targets remaining to be fetched."""
+        if not self.__useResultCache:
+            return {}, targetChEMBLIdList
+        tD = self.__getResultCache(resultType)["targets"]
+        rD = {tId: tD[tId] for tId in targetChEMBLIdList if tD.get(tId)}
+        idList = [tId for tId in targetChEMBLIdList if not tD.get(tId)]
+        logger.info("Using cached %s results for (%d/%d) targets", resultType, len(targetChEMBLIdList) - len(idList), len(targetChEMBLIdList))
+        return rD, idList
+
+    def __updateResultCache(self, resultType, idList, targetD):
+        """Record the fetched non-empty results for the input targets in the on-disk cache.
+        Targets without results (or with failed requests) are fetched again on the next call.
+        """
+        if not self.__useResultCache:
+            return
+        cD = self.__getResultCache(resultType)
+        tD = {tId: targetD[tId] for tId in idList if targetD.get(tId)}
+        if not tD:
+            return
+        cD["targets"].update(tD)
+        cD["updated"] = datetime.datetime.now().isoformat()
+        ok = fastJsonDump(self.__getResultCachePath(resultType), cD)
+        logger.info("Wrote %s results cache for (%d) targets (%r)", resultType, len(cD["targets"]), ok)
+
+    def __fetchChunks(self, queryFn, idList, chunkSize=50, numThreads=8):
+        """Yield the (identifier chunk, materialized query results or None on failure) for each chunk
+        of identifiers (in completion order).  The I/O bound chunk requests are issued concurrently in a thread pool.
+        """
+        with ThreadPoolExecutor(max_workers=numThreads) as executor:
+            futureD = {}
+            for ii in range(0, len(idList), chunkSize):
+                idChunk = idList[ii : ii + chunkSize]
+                futureD[executor.submit(self.__fetchChunk, queryFn, idChunk)] = idChunk
+            for future in as_completed(futureD):
+                yield futureD[future], future.result()
+
+    def __fetchChunk(self, queryFn, idChunk):
+        """Return the materialized query results for the input chunk of identifiers or None on failure.
+        A chunk rejected as too large (HTTP 400/414) is retried as two half-size chunks.
+        """
+        try:
+            return list(attachChEMBLSession(queryFn(idChunk)))
+        except Exception as e:
+            if len(idChunk) > 1 and _getHttpStatusCode(e) in _SPLIT_STATUS_CODES:
+                logger.warning("Retrying rejected chunk (%d) as two half-size chunks (%s)", len(idChunk), str(e)[:200])
+                mid = len(idChunk) // 2
+                rL1 = self.__fetchChunk(queryFn, idChunk[:mid])
+                rL2 = self.__fetchChunk(queryFn, idChunk[mid:])
+                return rL1 + rL2 if rL1 is not None and rL2 is not None else None
+            logger.error("Failing for chunk (%d) starting with %r with %s", len(idChunk), idChunk[0], str(e)[:200])
+        return None
+
     def __activitySelect(self, aD):
-        atL = [
-            "assay_chembl_id",
-            "assay_description",
-            "assay_type",
-            "canonical_smiles",
-            "ligand_efficiency",
-            "molecule_chembl_id",
-            "parent_molecule_chembl_id",
-            "pchembl_value",
-            "standard_relation",
-            "standard_type",
-            "standard_units",
-            "standard_value",
-            "target_chembl_id",
-        ]
-        return {at: aD[at] if at in aD else None for at in atL}
-
-    def getMechanismData(self, targetChEMBLIdList):
-        """Get mechanism data for the input ChEMBL target list.
+        return {at: aD.get(at) for at in _ACTIVITY_ATTRIBUTES}
+
+    def getMechanismData(self, targetChEMBLIdList, chunkSize=50, numThreads=8):
+        """Get mechanism data for the input ChEMBL target list.  With useResultCache=True, non-empty
+        results cached for the current ChEMBL version within resultCacheMaxAgeDays (default: 30)
+        are returned without a new request.
 
         Args:
             targetChEMBLIdList (list): list of ChEMBL target identifiers
+            chunkSize (int, optional): number of target identifiers per request (default: 50)
+            numThreads (int, optional): number of concurrent chunk requests (default: 8)
 
         Returns:
           (dict):  dictionary  {ChEMBId: {mechanism data}}
 
         """
-        oD = {}
-        chunkSize = 50
+        targetChEMBLIdList = self.__selectTargetIds(targetChEMBLIdList)
+        oD, idList = self.__getCachedResults("mechanism", targetChEMBLIdList)
         try:
-            for ii in range(0, len(targetChEMBLIdList), chunkSize):
-                mch = new_client.mechanism  # pylint: disable=no-member
-                mch.set_format("json")
-                mDL = mch.filter(target_chembl_id__in=targetChEMBLIdList[ii : ii + chunkSize])
-                if mDL:
-                    logger.info("mDL (%d)", len(mDL))
-                    for mD in mDL:
-                        oD.setdefault(mD["target_chembl_id"], []).append(mD)
+            failS = set()
+            for idChunk, mDL in self.__fetchChunks(self.__mechanismQuery, idList, chunkSize=chunkSize, numThreads=numThreads):
+                if mDL is None:
+                    failS.update(idChunk)
+                    continue
+                for mD in mDL:
+                    oD.setdefault(mD["target_chembl_id"], []).append(mD)
+                logger.info("mDL (%d)", len(mDL))
+            if failS:
+                logger.info("Mechanism requests failed for (%d/%d) targets", len(failS), len(idList))
+            self.__updateResultCache("mechanism", [tId for tId in idList if tId not in failS], oD)
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         return oD
@@ -4,6 +4,8 @@
 #
 #  Updated:
 #  20-Aug-2024 dwp Add support for loading and accessing data on MongoDB
+#  16-Oct-2026 dwp Decode matched entity identifiers and fetch the target cofactors once per query
+#  16-Oct-2026 dwp Build the cofactor list once per target and share it across the matching entity records
 ##
 """
 Accessors for DrugBank target cofactors.
@@ -22,6 +24,19 @@ from rcsb.utils.targets.TargetCofactorDbProvider import TargetCofactorDbProvider
 
 logger = logging.getLogger(__name__)
 
+# Cofactor record fields and the corresponding DrugBank target data fields
+_COFACTOR_FIELDS = (
+    ("cofactor_id", "drugbank_id"),
+    ("molecule_name", "name"),
+    ("target_name", "target_name"),
+    # ("description", "description"),
+    ("moa", "moa"),
+    # ("pharmacology", "pharmacology"),
+    ("inchi_key", "inchi_key"),
+    ("smiles", "smiles"),
+    ("pubmed_ids", "pubmed_ids"),
+)
+
 
 class DrugBankTargetCofactorProvider(StashableBase):
     """Accessors for DrugBank target cofactors."""
@@ -95,7 +110,8 @@ class DrugBankTargetCofactorProvider(StashableBase):
         Returns:
             bool: True for success or False otherwise
         """
-        rDL = []
+        qD = {}
+        cfCacheD = {}
         dbP = DrugBankTargetProvider(cachePath=self.__cachePath, useCache=True)
         if not dbP.testCache():
             logger.warning("Skipping build of target cofactor list because DrugBank Target data is missing.")
@@ -113,48 +129,26 @@ class DrugBankTargetCofactorProvider(StashableBase):
                 logger.info("Skipping target %r", unpId)
                 continue
             #
+            # Matched entity identifiers (decoded once per query)
+            matchEntityL = []
+            for matchD in matchDL:
+                tCmtD = self.__decodeComment(matchD["target"])
+                entryId, entityId = tCmtD["entityId"].split("_")[:2]
+                matchEntityL.append((matchD, entryId, entityId))
             # --
-            chemCompNeighborsD = {}
+            chemCompNeighborS = set()
             if lnmpObj:
-                for matchD in matchDL:
-                    tCmtD = self.__decodeComment(matchD["target"])
-                    entryId = tCmtD["entityId"].split("_")[0]
-                    entityId = tCmtD["entityId"].split("_")[1]
-                    rcsbEntityId = entryId + "_" + entityId
-                    chemCompIdList = lnmpObj.getLigandNeighbors(rcsbEntityId)
-                    chemCompNeighborsD.update({k: True for k in chemCompIdList})
+                for _, entryId, entityId in matchEntityL:
+                    chemCompNeighborS.update(lnmpObj.getLigandNeighbors(entryId + "_" + entityId))
             # --
+            # Cofactors with local ids are built once per target (the neighbor flag depends on the query matches)
+            if unpId not in cfCacheD:
+                cfCacheD[unpId] = [self.__addLocalIds({cfKey: dbD[dbKey] for cfKey, dbKey in _COFACTOR_FIELDS}, crmpObj) for dbD in dbP.getCofactors(unpId)]
+            # This list is shared by all of the records for the query and must not be modified downstream
+            cfDL = [dict(cfD, neighbor_in_pdb="Y" if cfD.get("chem_comp_id") in chemCompNeighborS else "N") for cfD in cfCacheD[unpId]]
+            queryName = cfDL[0]["target_name"] if cfDL and "target_name" in cfDL[0] else None
             #
-            for matchD in matchDL:
-                tCmtD = self.__decodeComment(matchD["target"])
-                entryId = tCmtD["entityId"].split("_")[0]
-                entityId = tCmtD["entityId"].split("_")[1]
-                # --
-                dbDL = dbP.getCofactors(unpId)
-                # --
-                cfDL = []
-                for dbD in dbDL:
-                    cfD = {}
-                    cfD["cofactor_id"] = dbD["drugbank_id"]
-                    cfD["molecule_name"] = dbD["name"]
-                    cfD["target_name"] = dbD["target_name"]
-                    # cfD["description"] = dbD["description"]
-                    cfD["moa"] = dbD["moa"]
-                    # cfD["pharmacology"] = dbD["pharmacology"]
-                    cfD["inchi_key"] = dbD["inchi_key"]
-                    cfD["smiles"] = dbD["smiles"]
-                    cfD["pubmed_ids"] = dbD["pubmed_ids"]
-                    cfD = self.__addLocalIds(cfD, crmpObj)
-                    #
-                    if "chem_comp_id" in cfD and cfD["chem_comp_id"] in chemCompNeighborsD:
-                        cfD["neighbor_in_pdb"] = "Y"
-                    else:
-                        cfD["neighbor_in_pdb"] = "N"
-                    #
-                    cfDL.append(cfD)
-                # ---
-                queryName = cfDL[0]["target_name"] if cfDL and "target_name" in cfDL[0] else None
-                # ---
+            for matchD, entryId, entityId in matchEntityL:
                 # aligned_target.entity_beg_seq_id (current target is PDB entity in json)
                 # aligned_target.target_beg_seq_id (current query is target seq in json)
                 # aligned_target.length
@@ -196,12 +190,8 @@ class DrugBankTargetCofactorProvider(StashableBase):
                     "lca_taxonomy_rank": matchD["lcaRank"] if "lcaRank" in matchD else None,
                     "cofactors": cfDL,
                 }
-                rDL.append(rD)
+                qD.setdefault(entryId + "_" + entityId, []).append(rD)
         #
-        qD = {}
-        for rD in rDL:
-            eId = rD["entry_id"] + "_" + rD["entity_id"]
-            qD.setdefault(eId, []).append(rD)
         fp = self.__getCofactorDataPath(fmt=self.__fmt)
         tS = datetime.datetime.now().isoformat()
         # vS = datetime.datetime.now().strftime("%Y-%m-%d")
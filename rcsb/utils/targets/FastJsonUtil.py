@@ -0,0 +1,207 @@
+##
+#  File:           FastJsonUtil.py
+#  Date:           16-Oct-2026 dwp
+#
+#  Updated:
+#  16-Oct-2026 dwp  Add fastJsonLoadStream() to read streamed files item by item
+##
+"""
+Fast JSON serialization helpers for large target data cache files.
+
+"""
+
+import gzip
+import json
+import logging
+import os
+
+# pylint: disable=ungrouped-imports
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _openFile(filePath, mode):
+    """Open a plain or gzip compressed (.gz) file in binary mode (fast compression on write)."""
+    if filePath.endswith(".gz"):
+        return gzip.open(filePath, mode, compresslevel=1) if "w" in mode else gzip.open(filePath, mode)
+    return open(filePath, mode)
+
+
+def fastJsonDump(filePath, obj, indent=False):
+    """Serialize the input object to a JSON file using orjson (if available) or the standard library.
+
+    The output is written to a temporary file which then replaces the target path.
+    Paths ending in .gz are gzip compressed.
+
+    Args:
+        filePath (str): output JSON file path
+        obj (object): JSON serializable object
+        indent (bool, optional): pretty print the output (default: False)
+
+    Returns:
+        bool: True for success or False otherwise
+    """
+    tmpPath = filePath[:-3] + ".tmp.gz" if filePath.endswith(".gz") else filePath + ".tmp"
+    try:
+        dirPath = os.path.dirname(filePath)
+        if dirPath and not os.path.isdir(dirPath):
+            os.makedirs(dirPath)
+        with _openFile(tmpPath, "wb") as ofh:
+            if orjson:
+                ofh.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0))
+            else:
+                ofh.write(json.dumps(obj, indent=2 if indent else None).encode("utf-8"))
+        os.replace(tmpPath, filePath)
+        return True
+    except Exception as e:
+        logger.exception("Failing for %r with %s", filePath, str(e))
+    return False
+
+
+def fastJsonDumpStream(filePath, headerD, streamKey, streamD):
+    """Serialize a JSON object with a large dictionary member to a file, writing the
+    large member incrementally one item at a time to bound peak memory.
+
+    The output object contains the members of headerD followed by the member streamKey
+    with the value streamD.  Each item of the streamed member is written on a separate
+    line so that the file can be read back incrementally by fastJsonLoadStream().
+    Paths ending in .gz are gzip compressed.
+
+    Args:
+        filePath (str): output JSON file path
+        headerD (dict): small JSON serializable dictionary of leading members
+        streamKey (str): key for the streamed member
+        streamD (dict): JSON serializable dictionary serialized item by item
+
+    Returns:
+        bool: True for success or False otherwise
+    """
+    tmpPath = filePath[:-3] + ".tmp.gz" if filePath.endswith(".gz") else filePath + ".tmp"
+    dumps = (lambda obj: orjson.dumps(obj)) if orjson else (lambda obj: json.dumps(obj).encode("utf-8"))
+    try:
+        dirPath = os.path.dirname(filePath)
+        if dirPath and not os.path.isdir(dirPath):
+            os.makedirs(dirPath)
+        with _openFile(tmpPath, "wb") as ofh:
+            ofh.write(b"{")
+            for key, value in headerD.items():
+                ofh.write(dumps(key) + b":" + dumps(value) + b",")
+            ofh.write(dumps(streamKey) + b":{\n")
+            for ii, (key, value) in enumerate(streamD.items()):
+                ofh.write((b",\n" if ii else b"") + dumps(key) + b":" + dumps(value))
+            ofh.write(b"\n}}")
+        os.replace(tmpPath, filePath)
+        return True
+    except Exception as e:
+        logger.exception("Failing for %r with %s", filePath, str(e))
+    return False
+
+
+def fastJsonLoadStream(filePath, streamKey):
+    """Deserialize a JSON file written by fastJsonDumpStream(), parsing the streamed member
+    one line (item) at a time so that the raw file content is never held in memory.
+
+    Files in any other layout (e.g., written by fastJsonDump()) are read in full.
+
+    Args:
+        filePath (str): input JSON file path
+        streamKey (str): key for the streamed member
+
+    Returns:
+        (dict, dict): leading members, streamed member dictionary or (None, None) on failure
+    """
+    loads = orjson.loads if orjson else json.loads
+    opener = (orjson.dumps(streamKey) if orjson else json.dumps(streamKey).encode("utf-8")) + b":{\n"
+    try:
+        with _openFile(filePath, "rb") as ifh:
+            line = ifh.readline()
+            if not line.endswith(opener):
+                obj = loads(line + ifh.read())
+                streamD = obj.pop(streamKey, {})
+                return obj, streamD
+            headerD = loads(line[: -len(opener)].rstrip(b",") + b"}")
+            streamD = {}
+            for line in ifh:
+                line = line.rstrip(b"\n").rstrip(b",")
+                if line == b"}}":
+                    break
+                if line:
+                    streamD.update(loads(b"{" + line + b"}"))
+            else:
+                raise ValueError("Incomplete streamed member %r" % streamKey)
+            return headerD, streamD
+    except Exception as e:
+        logger.exception("Failing for %r with %s", filePath, str(e))
+    return None, None
+
+
+def fastJsonLoad(filePath):
+    """Deserialize the JSON file using orjson (if available) or the standard library.
+    Paths ending in .gz are read as gzip compressed files.
+
+    Args:
+        filePath (str): input JSON file path
+
+    Returns:
+        object: deserialized object or None on failure
+    """
+    try:
+        with _openFile(filePath, "rb") as ifh:
+            if orjson:
+                return orjson.loads(ifh.read())
+            return json.loads(ifh.read())
+    except Exception as e:
+        logger.exception("Failing for %r with %s", filePath, str(e))
+    return None
+
+
+def fastJsonLinesAppend(filePath, objList):
+    """Append the input objects to a JSON lines (JSONL) file, one serialized object per line.
+
+    Args:
+        filePath (str): output JSONL file path
+        objList (list): list of JSON serializable objects
+
+    Returns:
+        bool: True for success or False otherwise
+    """
+    try:
+        dirPath = os.path.dirname(filePath)
+        if dirPath and not os.path.isdir(dirPath):
+            os.makedirs(dirPath)
+        with open(filePath, "ab") as ofh:
+            for obj in objList:
+                ofh.write((orjson.dumps(obj) if orjson else json.dumps(obj).encode("utf-8")) + b"\n")
+        return True
+    except Exception as e:
+        logger.exception("Failing for %r with %s", filePath, str(e))
+    return False
+
+
+def fastJsonLinesLoad(filePath):
+    """Read the objects in a JSON lines (JSONL) file.  Incomplete or corrupt lines
+    (e.g., from an interrupted append) are skipped.
+
+    Args:
+        filePath (str): input JSONL file path
+
+    Returns:
+        list: list of deserialized objects
+    """
+    objList = []
+    try:
+        with open(filePath, "rb") as ifh:
+            for line in ifh:
+                if not line.strip():
+                    continue
+                try:
+                    objList.append(orjson.loads(line) if orjson else json.loads(line))
+                except ValueError:
+                    logger.warning("Skipping incomplete line in %r", filePath)
+    except Exception as e:
+        logger.exception("Failing for %r with %s", filePath, str(e))
+    return objList
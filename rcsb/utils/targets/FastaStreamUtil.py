@@ -0,0 +1,81 @@
+##
+#  File:           FastaStreamUtil.py
+#  Date:           16-Oct-2026 dwp
+#
+#  Updated:
+#  16-Oct-2026 dwp  Add fastaWrite() to write records as they are produced
+#  16-Oct-2026 dwp  Use a 1MB output buffer in fastaWrite()
+#  16-Oct-2026 dwp  Remove the temporary file and re-raise on fastaWrite() failures
+##
+"""
+Streaming FASTA helpers for large target sequence files.
+
+"""
+
+import gzip
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def fastaIter(filePath):
+    """Iterate over the records in a plain or gzip compressed (.gz) FASTA file one at a time.
+
+    Args:
+        filePath (str): input FASTA file path
+
+    Yields:
+        (str, str): sequence header (without the leading '>') and sequence
+    """
+    seqId = None
+    seqL = []
+    with gzip.open(filePath, "rt") if filePath.endswith(".gz") else open(filePath, "r") as ifh:
+        for line in ifh:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith(">"):
+                if seqId is not None:
+                    yield seqId, "".join(seqL)
+                seqId = line[1:].strip()
+                seqL = []
+            elif seqId is not None:
+                seqL.append(line)
+    if seqId is not None:
+        yield seqId, "".join(seqL)
+
+
+def fastaWrite(filePath, recordIter, maxLineLength=80):
+    """Write the input (header, sequence) records to a FASTA file as they are produced.
+
+    The output is written to a temporary file which then replaces the target path.
+
+    Args:
+        filePath (str): output FASTA file path
+        recordIter (iterable): iterable of (header, sequence) tuples
+        maxLineLength (int, optional): maximum sequence line length (default: 80)
+
+    Returns:
+        bool: True for success
+
+    Raises:
+        Exception: errors raised while producing or writing the records (the temporary file is removed)
+    """
+    tmpPath = filePath + ".tmp"
+    dirPath = os.path.dirname(filePath)
+    if dirPath and not os.path.isdir(dirPath):
+        os.makedirs(dirPath)
+    try:
+        with open(tmpPath, "w", buffering=1 << 20) as ofh:
+            for seqId, seq in recordIter:
+                ofh.write(">%s\n" % seqId)
+                for ii in range(0, len(seq), maxLineLength):
+                    ofh.write(seq[ii : ii + maxLineLength] + "\n")
+        os.replace(tmpPath, filePath)
+    except Exception as e:
+        logger.error("Failing for %r with %s", filePath, str(e))
+        if os.path.exists(tmpPath):
+            os.remove(tmpPath)
+        raise
+    return True
@@ -5,6 +5,9 @@
 #  Updated:
 #   3-Mar-2023 aae Handle missing activityType in buildCofactorList
 #  20-Aug-2024 dwp Add support for loading and accessing data on MongoDB
+#  16-Oct-2026 dwp Select the top unmapped activity records with heapq.nlargest
+#  16-Oct-2026 dwp Decode matched entities and build the activity records once per query
+#  16-Oct-2026 dwp Keep the ligand neighbor chemical components in a set
 #
 ##
 """
@@ -12,7 +15,9 @@ Accessors for Pharos target cofactor data.
 """
 
 import datetime
+import heapq
 import logging
+import operator
 import os.path
 import time
 
@@ -24,6 +29,8 @@ from rcsb.utils.targets.TargetCofactorDbProvider import TargetCofactorDbProvider
 
 logger = logging.getLogger(__name__)
 
+_MEASUREMENT_KEY = operator.itemgetter("measurement_value")
+
 
 class PharosTargetCofactorProvider(StashableBase):
     """Accessors for Pharos target cofactors."""
@@ -118,7 +125,8 @@ class PharosTargetCofactorProvider(StashableBase):
                         "patent": "USxxxxxx",
                     }, ...
         """
-        rDL = []
+        # Cofactor records grouped by entity identifier
+        qD = {}
         mD = self.__mU.doImport(sequenceMatchFilePath, fmt="json")
         # ---
         chaP = PharosTargetActivityProvider(cachePath=self.__cachePath, useCache=True)
@@ -146,51 +154,48 @@ class PharosTargetCofactorProvider(StashableBase):
                 logger.debug("Skipping target with no activities %r (%r)", unpId, pharosId)
                 # continue
             # --
-            chemCompNeighborsD = {}
+            # Matched entity identifiers are decoded once and reused for the neighbor index and the output records
+            matchEntityL = []
+            for matchD in matchDL:
+                entryId, entityId = self.__decodeComment(matchD["target"])["entityId"].split("_")[:2]
+                matchEntityL.append((matchD, entryId, entityId))
+            chemCompNeighborS = set()
             if lnmpObj:
-                for matchD in matchDL:
-                    tCmtD = self.__decodeComment(matchD["target"])
-                    entryId = tCmtD["entityId"].split("_")[0]
-                    entityId = tCmtD["entityId"].split("_")[1]
-                    rcsbEntityId = entryId + "_" + entityId
-                    chemCompIdList = lnmpObj.getLigandNeighbors(rcsbEntityId)
-                    chemCompNeighborsD.update({k: True for k in chemCompIdList})
+                for _, entryId, entityId in matchEntityL:
+                    chemCompNeighborS.update(lnmpObj.getLigandNeighbors(entryId + "_" + entityId))
             # --
             queryName = chaP.getTargetInfo(pharosId, "name")
             # --
-            for matchD in matchDL:
-                tCmtD = self.__decodeComment(matchD["target"])
-                entryId = tCmtD["entityId"].split("_")[0]
-                entityId = tCmtD["entityId"].split("_")[1]
-                rcsbEntityId = entryId + "_" + entityId
-                #
-                taDL = chaP.getTargetActivity(pharosId)
-                logger.debug("Target %r has (%d) activity records", pharosId, len(taDL))
-                actL = []
-                # cfDL = []
-                chD = {}
-                for taD in taDL:
-                    if taD["chemblId"] in chD:
-                        chD[taD["chemblId"]] = True
-                        continue
-
-                    actD = {
-                        "cofactor_id": taD["chemblId"],
-                        "cofactor_name": taD["molecule_name"] if "name" in taD else None,
-                        "measurement_type": "p" + taD["activityType"] if "activityType" in taD else None,
-                        "measurement_value": taD["activity"],
-                        "pubmed_ids": [taD["pubmedId"]] if "pubmedId" in taD else None,
-                        "patent_nos": taD["patents"] if "patents" in taD else None,
-                        "smiles": taD["smiles"] if "smiles" in taD else None,
-                        "action": taD["action"] if "action" in taD else None,
-                        "pharmacology": taD["pharmacology"] if "pharmacology" in taD else None,
-                    }
-                    actD = self.__addLocalIds(actD, crmpObj=crmpObj)
-                    actL.append(actD)
-                #
-                actL = self.__activityListSelect(actL, chemCompNeighborsD, maxActivity=maxActivity)
-                if not actL:
-                    logger.debug("No Pharos cofactors for %s %s", pharosId, unpId)
+            # Activity records depend only on the Pharos target, so these are built and selected once for all matched entities
+            taDL = chaP.getTargetActivity(pharosId)
+            logger.debug("Target %r has (%d) activity records", pharosId, len(taDL))
+            actL = []
+            # cfDL = []
+            chD = {}
+            for taD in taDL:
+                if taD["chemblId"] in chD:
+                    chD[taD["chemblId"]] = True
+                    continue
+
+                actD = {
+                    "cofactor_id": taD["chemblId"],
+                    "cofactor_name": taD["molecule_name"] if "name" in taD else None,
+                    "measurement_type": "p" + taD["activityType"] if "activityType" in taD else None,
+                    "measurement_value": taD["activity"],
+                    "pubmed_ids": [taD["pubmedId"]] if "pubmedId" in taD else None,
+                    "patent_nos": taD["patents"] if "patents" in taD else None,
+                    "smiles": taD["smiles"] if "smiles" in taD else None,
+                    "action": taD["action"] if "action" in taD else None,
+                    "pharmacology": taD["pharmacology"] if "pharmacology" in taD else None,
+                }
+                actD = self.__addLocalIds(actD, crmpObj=crmpObj)
+                actL.append(actD)
+            #
+            actL = self.__activityListSelect(actL, chemCompNeighborS, maxActivity=maxActivity)
+            if not actL:
+                logger.debug("No Pharos cofactors for %s %s", pharosId, unpId)
+            # --
+            for matchD, entryId, entityId in matchEntityL:
                 # ---
                 # aligned_target.entity_beg_seq_id (current target is PDB entity in json)
                 # aligned_target.target_beg_seq_id (current query is target seq in json)
@@ -231,14 +236,9 @@ class PharosTargetCofactorProvider(StashableBase):
                     "lca_taxonomy_id": matchD["lcaTaxId"] if "lcaTaxId" in matchD else None,
                     "lca_taxonomy_name": matchD["lcaTaxName"] if "lcaTaxName" in matchD else None,
                     "lca_taxonomy_rank": matchD["lcaRank"] if "lcaRank" in matchD else None,
-                    "cofactors": actL,
+                    "cofactors": list(actL),
                 }
-                rDL.append(rD)
-        #
-        qD = {}
-        for rD in rDL:
-            eId = rD["entry_id"] + "_" + rD["entity_id"]
-            qD.setdefault(eId, []).append(rD)
+                qD.setdefault(entryId + "_" + entityId, []).append(rD)
         #
         fp = self.__getCofactorDataPath()
         tS = datetime.datetime.now().isoformat()
@@ -259,12 +259,12 @@ class PharosTargetCofactorProvider(StashableBase):
                     cfD["chem_comp_id"] = localId
         return cfD
 
-    def __activityListSelect(self, activityDL, chemCompNeighborsD, maxActivity=5):
+    def __activityListSelect(self, activityDL, chemCompNeighborS, maxActivity=5):
         """Prioritizing the activity data for locally mapped neighbor ligands and the best binding examples.
 
         Args:
             activityDL (list): full list of activity objects
-            chemCompNeighborsD (dict, optional): index of all chemical components with neighbor interactions to the query target. Defaults {}.
+            chemCompNeighborS (set): all chemical components with neighbor interactions to the query target
             maxCount (int, optional): maximum number of activity object returned. Defaults to 5.
 
         Returns:
@@ -274,11 +274,11 @@ class PharosTargetCofactorProvider(StashableBase):
         mappedNeighborL = []
         unmappedL = activityDL
 
-        if chemCompNeighborsD:
+        if chemCompNeighborS:
             unmappedL = []
             # Select out the any cases for molecules that map to a neighbor chemical component.
             for activityD in activityDL:
-                if "chem_comp_id" in activityD and activityD["chem_comp_id"] in chemCompNeighborsD:
+                if activityD.get("chem_comp_id") in chemCompNeighborS:
                     activityD["neighbor_in_pdb"] = "Y"
                     mappedNeighborL.append(activityD)
                 else:
@@ -287,13 +287,12 @@ class PharosTargetCofactorProvider(StashableBase):
         #
         numLeft = maxActivity - len(mappedNeighborL)
         if numLeft > 0:
-            unmappedL = sorted(unmappedL, key=lambda k: k["measurement_value"], reverse=True)
             retL = mappedNeighborL
-            retL.extend(unmappedL[:numLeft])
-            retL = sorted(retL, key=lambda k: k["measurement_value"], reverse=True)
+            retL.extend(heapq.nlargest(numLeft, unmappedL, key=_MEASUREMENT_KEY))
+            retL.sort(key=_MEASUREMENT_KEY, reverse=True)
         else:
             logger.debug("Mapped neighbor cofactors (%d) excluded unmapped (%d)", len(mappedNeighborL), len(unmappedL))
-            retL = sorted(mappedNeighborL, key=lambda k: k["measurement_value"], reverse=True)
+            retL = sorted(mappedNeighborL, key=_MEASUREMENT_KEY, reverse=True)
 
         return retL
 
@@ -0,0 +1,70 @@
+##
+# File:    testChEMBLSessionUtil.py
+# Author:  Dennis Piehl
+# Date:    16-Oct-2026
+# Version: 0.001
+#
+# Update:
+#
+#
+##
+"""
+Tests for the shared ChEMBL session utilities.
+"""
+
+__docformat__ = "google en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import threading
+import time
+import unittest
+
+from rcsb.utils.targets.ChEMBLSessionUtil import _RateLimiter, setChEMBLRateLimit
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(HERE))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+
+class ChEMBLSessionUtilTests(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        setChEMBLRateLimit(None)
+
+    def testRateLimiter(self):
+        rL = _RateLimiter(20)
+        startTime = time.monotonic()
+        for _ in range(6):
+            rL.wait()
+        # The first request is immediate and the remaining requests are spaced at 0.05 seconds
+        self.assertGreaterEqual(time.monotonic() - startTime, 0.24)
+
+    def testRateLimiterThreaded(self):
+        rL = _RateLimiter(20)
+        startTime = time.monotonic()
+        threadL = [threading.Thread(target=rL.wait) for _ in range(6)]
+        for th in threadL:
+            th.start()
+        for th in threadL:
+            th.join()
+        self.assertGreaterEqual(time.monotonic() - startTime, 0.24)
+
+
+def sessionUtilSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(ChEMBLSessionUtilTests("testRateLimiter"))
+    suiteSelect.addTest(ChEMBLSessionUtilTests("testRateLimiterThreaded"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = sessionUtilSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -20,7 +20,7 @@ import logging
 import os
 import unittest
 
-from rcsb.utils.targets.ChEMBLTargetActivityProvider import ChEMBLTargetActivityProvider
+from rcsb.utils.targets.ChEMBLTargetActivityProvider import ChEMBLTargetActivityProvider, ChEMBLTargetActivityWorker
 from rcsb.utils.io.MarshalUtil import MarshalUtil
 
 HERE = os.path.abspath(os.path.dirname(__file__))
@@ -64,6 +64,20 @@ class ChEMBLTargetActivityProviderTests(unittest.TestCase):
             logger.exception("Failing with %s", str(e))
             self.fail()
 
+    def testFetchMoleculeDataBatch(self):
+        try:
+            ctW = ChEMBLTargetActivityWorker()
+            chemblIdL = ["CHEMBL1421", "CHEMBL200117"]
+            molD = ctW.getMoleculeDetailsBatch(chemblIdL)
+            self.assertEqual(len(molD), 2)
+            self.assertEqual(molD["CHEMBL1421"][0], "DASATINIB")
+            self.assertEqual(molD["CHEMBL1421"][1], "ZBNZXTGUTAYRHI-UHFFFAOYSA-N")
+            mechD = ctW.getMechanismDetailsBatch(chemblIdL)
+            self.assertEqual(mechD["CHEMBL1421"], ctW.getMechanismDetails("CHEMBL1421"))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
     def testFetchActivityDataMulti(self):
         try:
             ctP = ChEMBLTargetActivityProvider(cachePath=self.__cachePath, useCache=False)
@@ -81,6 +95,23 @@ class ChEMBLTargetActivityProviderTests(unittest.TestCase):
             logger.exception("Failing with %s", str(e))
             self.fail()
 
+    def testFetchActivityDataThreaded(self):
+        try:
+            ctP = ChEMBLTargetActivityProvider(cachePath=self.__cachePath, useCache=False)
+            ok = ctP.testCache()
+            self.assertFalse(ok)
+            #
+            tL = ["CHEMBL1987", "CHEMBL3243"]
+            ok = ctP.fetchTargetActivityDataThreaded(tL, chunkSize=1, numThreads=2)
+            self.assertTrue(ok)
+            ctP.reload()
+            ok = ctP.testCache(minCount=2)
+            self.assertTrue(ok)
+
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
     def testFetchActivityData(self):
         try:
             ctP = ChEMBLTargetActivityProvider(cachePath=self.__cachePath, useCache=False)
@@ -98,6 +129,13 @@ class ChEMBLTargetActivityProviderTests(unittest.TestCase):
             ctP.reload()
             ok = ctP.testCache()
             self.assertTrue(ok)
+            #
+            ctP = ChEMBLTargetActivityProvider(cachePath=self.__cachePath, useCache=True, loadKeysOnly=True)
+            ok = ctP.testCache()
+            self.assertTrue(ok)
+            for tId in tL:
+                if ctP.hasTargetActivity(tId):
+                    self.assertGreater(len(ctP.getTargetActivity(tId)), 0)
 
         except Exception as e:
             logger.exception("Failing with %s", str(e))
@@ -108,8 +146,10 @@ def targetActivitySuite():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(ChEMBLTargetActivityProviderTests("testFetchStatus"))
     suiteSelect.addTest(ChEMBLTargetActivityProviderTests("testFetchMoleculeData"))
+    suiteSelect.addTest(ChEMBLTargetActivityProviderTests("testFetchMoleculeDataBatch"))
     suiteSelect.addTest(ChEMBLTargetActivityProviderTests("testFetchActivityData"))
     suiteSelect.addTest(ChEMBLTargetActivityProviderTests("testFetchActivityDataMulti"))
+    suiteSelect.addTest(ChEMBLTargetActivityProviderTests("testFetchActivityDataThreaded"))
     return suiteSelect
 
 
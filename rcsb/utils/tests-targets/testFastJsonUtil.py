@@ -0,0 +1,142 @@
+##
+# File:    testFastJsonUtil.py
+# Author:  Dennis Piehl
+# Date:    16-Oct-2026
+# Version: 0.001
+#
+# Update:
+#
+#
+##
+"""
+Tests for fast JSON serialization helpers.
+"""
+
+__docformat__ = "google en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from rcsb.utils.targets import FastJsonUtil
+from rcsb.utils.targets.FastJsonUtil import fastJsonDump, fastJsonDumpStream, fastJsonLinesAppend, fastJsonLinesLoad, fastJsonLoad, fastJsonLoadStream
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(HERE))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+
+class FastJsonUtilTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp(prefix="fast-json-test-")
+        self.__dataD = {"version": "2026-10-16", "activity": {"CHEMBL3243": [{"pchembl_value": "5.78", "ligand_efficiency": None}]}, "all_ids": ["CHEMBL3243"]}
+
+    def tearDown(self):
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+
+    def testJsonRoundTrip(self):
+        for indent, ext in [(False, "json"), (True, "json"), (False, "json.gz")]:
+            fp = os.path.join(self.__workPath, "fast-json-test-%d.%s" % (int(indent), ext))
+            ok = fastJsonDump(fp, self.__dataD, indent=indent)
+            self.assertTrue(ok)
+            self.assertFalse(os.path.exists(fp + ".tmp"))
+            self.assertFalse(os.path.exists(fp[:-3] + ".tmp.gz"))
+            rD = fastJsonLoad(fp)
+            self.assertEqual(rD, self.__dataD)
+
+    def testJsonDumpStream(self):
+        fp = os.path.join(self.__workPath, "fast-json-stream-test.json.gz")
+        for streamD in [self.__dataD["activity"], {}]:
+            ok = fastJsonDumpStream(fp, {"version": self.__dataD["version"], "all_ids": self.__dataD["all_ids"]}, "activity", streamD)
+            self.assertTrue(ok)
+            rD = fastJsonLoad(fp)
+            self.assertEqual(rD, {"version": self.__dataD["version"], "all_ids": self.__dataD["all_ids"], "activity": streamD})
+            hD, sD = fastJsonLoadStream(fp, "activity")
+            self.assertEqual(hD, {"version": self.__dataD["version"], "all_ids": self.__dataD["all_ids"]})
+            self.assertEqual(sD, streamD)
+
+    def testJsonLoadStream(self):
+        # Files not written by fastJsonDumpStream() are read in full
+        fp = os.path.join(self.__workPath, "fast-json-stream-test-full.json.gz")
+        for indent in [False, True]:
+            ok = fastJsonDump(fp, self.__dataD, indent=indent)
+            self.assertTrue(ok)
+            hD, sD = fastJsonLoadStream(fp, "activity")
+            self.assertEqual(hD, {"version": self.__dataD["version"], "all_ids": self.__dataD["all_ids"]})
+            self.assertEqual(sD, self.__dataD["activity"])
+        # Truncated streamed files fail
+        fp = os.path.join(self.__workPath, "fast-json-stream-test-truncated.json")
+        activityD = {"CHEMBL%d" % ii: self.__dataD["activity"]["CHEMBL3243"] for ii in range(5)}
+        ok = fastJsonDumpStream(fp, {"version": self.__dataD["version"]}, "activity", activityD)
+        self.assertTrue(ok)
+        with open(fp, "rb") as ifh:
+            lines = ifh.readlines()
+        with open(fp, "wb") as ofh:
+            ofh.writelines(lines[:3])
+        hD, sD = fastJsonLoadStream(fp, "activity")
+        self.assertIsNone(hD)
+        self.assertIsNone(sD)
+
+    def testStdlibFallback(self):
+        # Files are interchangeable between the orjson and standard library code paths
+        fp = os.path.join(self.__workPath, "fast-json-test-stdlib.json.gz")
+        sp = os.path.join(self.__workPath, "fast-json-stream-test-stdlib.json")
+        lp = os.path.join(self.__workPath, "fast-json-test-stdlib.jsonl")
+        ok = fastJsonDump(fp, self.__dataD)
+        self.assertTrue(ok)
+        with mock.patch.object(FastJsonUtil, "orjson", None):
+            self.assertEqual(fastJsonLoad(fp), self.__dataD)
+            for indent in [False, True]:
+                ok = fastJsonDump(fp, self.__dataD, indent=indent)
+                self.assertTrue(ok)
+                self.assertEqual(fastJsonLoad(fp), self.__dataD)
+            ok = fastJsonDumpStream(sp, {"version": self.__dataD["version"]}, "activity", self.__dataD["activity"])
+            self.assertTrue(ok)
+            hD, sD = fastJsonLoadStream(sp, "activity")
+            self.assertEqual(hD, {"version": self.__dataD["version"]})
+            self.assertEqual(sD, self.__dataD["activity"])
+            ok = fastJsonLinesAppend(lp, [{"chunk": 0}, {"chunk": 1}])
+            self.assertTrue(ok)
+            self.assertEqual(fastJsonLinesLoad(lp), [{"chunk": 0}, {"chunk": 1}])
+        self.assertEqual(fastJsonLoad(fp), self.__dataD)
+        self.assertEqual(fastJsonLoadStream(sp, "activity")[1], self.__dataD["activity"])
+
+    def testJsonLoadMissing(self):
+        rD = fastJsonLoad(os.path.join(self.__workPath, "fast-json-missing.json"))
+        self.assertIsNone(rD)
+
+    def testJsonLinesAppend(self):
+        fp = os.path.join(self.__workPath, "fast-json-test.jsonl")
+        for ii in range(3):
+            ok = fastJsonLinesAppend(fp, [{"chunk": ii, "activity": self.__dataD["activity"]}])
+            self.assertTrue(ok)
+        # simulate an interrupted append
+        with open(fp, "ab") as ofh:
+            ofh.write(b'{"chunk": 3, "activ')
+        rL = fastJsonLinesLoad(fp)
+        self.assertEqual([rD["chunk"] for rD in rL], [0, 1, 2])
+        self.assertEqual(rL[0]["activity"], self.__dataD["activity"])
+
+
+def fastJsonSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(FastJsonUtilTests("testJsonRoundTrip"))
+    suiteSelect.addTest(FastJsonUtilTests("testJsonDumpStream"))
+    suiteSelect.addTest(FastJsonUtilTests("testJsonLoadStream"))
+    suiteSelect.addTest(FastJsonUtilTests("testStdlibFallback"))
+    suiteSelect.addTest(FastJsonUtilTests("testJsonLoadMissing"))
+    suiteSelect.addTest(FastJsonUtilTests("testJsonLinesAppend"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = fastJsonSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
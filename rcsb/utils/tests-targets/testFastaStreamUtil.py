@@ -0,0 +1,101 @@
+##
+# File:    testFastaStreamUtil.py
+# Author:  Dennis Piehl
+# Date:    16-Oct-2026
+# Version: 0.001
+#
+# Update:
+#
+#
+##
+"""
+Tests for streaming FASTA helpers.
+"""
+
+__docformat__ = "google en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import gzip
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from rcsb.utils.targets.FastaStreamUtil import fastaIter, fastaWrite
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(HERE))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+
+class FastaStreamUtilTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp(prefix="fasta-stream-test-")
+        self.__fastaText = "\n".join(
+            [
+                ">CHEMBL3243 [P08575] Leukocyte common antigen",
+                "MYLWLKLLAFGFAFLDTEVFVTG",
+                "QSPTPSPTGLTTAKM",
+                "",
+                ">CHEMBL1824 [P04626] Receptor protein-tyrosine kinase erbB-2",
+                "MELAALCRWGLLLALLPPGAASTQ",
+                "",
+            ]
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+
+    def testFastaIter(self):
+        expectedL = [
+            ("CHEMBL3243 [P08575] Leukocyte common antigen", "MYLWLKLLAFGFAFLDTEVFVTGQSPTPSPTGLTTAKM"),
+            ("CHEMBL1824 [P04626] Receptor protein-tyrosine kinase erbB-2", "MELAALCRWGLLLALLPPGAASTQ"),
+        ]
+        fp = os.path.join(self.__workPath, "fasta-stream-test.fa")
+        with open(fp, "w") as ofh:
+            ofh.write(self.__fastaText)
+        self.assertEqual(list(fastaIter(fp)), expectedL)
+        fp = os.path.join(self.__workPath, "fasta-stream-test.fa.gz")
+        with gzip.open(fp, "wt") as ofh:
+            ofh.write(self.__fastaText)
+        self.assertEqual(list(fastaIter(fp)), expectedL)
+
+    def testFastaWrite(self):
+        fp = os.path.join(self.__workPath, "fasta-write-test.fa")
+        recordL = [("CHEMBL3243|chemblId|P08575|uniprotId", "M" * 95), ("CHEMBL1824|chemblId|P04626|uniprotId", "MELAALCRWG")]
+        ok = fastaWrite(fp, iter(recordL), maxLineLength=40)
+        self.assertTrue(ok)
+        self.assertFalse(os.path.exists(fp + ".tmp"))
+        with open(fp, "r") as ifh:
+            self.assertEqual(max(len(line.strip()) for line in ifh if not line.startswith(">")), 40)
+        self.assertEqual(list(fastaIter(fp)), recordL)
+
+    def testFastaWriteFailure(self):
+        fp = os.path.join(self.__workPath, "fasta-write-fail-test.fa")
+
+        def failingIter():
+            yield "CHEMBL3243|chemblId|P08575|uniprotId", "MYLWLKLLAF"
+            raise ValueError("Truncated input")
+
+        with self.assertRaises(ValueError):
+            fastaWrite(fp, failingIter())
+        self.assertFalse(os.path.exists(fp))
+        self.assertFalse(os.path.exists(fp + ".tmp"))
+
+
+def fastaStreamSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(FastaStreamUtilTests("testFastaIter"))
+    suiteSelect.addTest(FastaStreamUtilTests("testFastaWrite"))
+    suiteSelect.addTest(FastaStreamUtilTests("testFastaWriteFailure"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = fastaStreamSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -59,7 +59,7 @@ setup(
     tests_require=["tox"],
     #
     # Not configured ...
-    extras_require={"dev": ["check-manifest"], "test": ["coverage"]},
+    extras_require={"dev": ["check-manifest"], "test": ["coverage"], "fast": ["orjson >= 3.8"]},
     # Added for
     command_options={"build_sphinx": {"project": ("setup.py", thisPackage), "version": ("setup.py", version), "release": ("setup.py", version)}},
     # This setting for namespace package support -